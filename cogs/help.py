@@ -1,325 +1,240 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
-from utils.helpers import create_embed
-import logging
+import functools
+from types import MappingProxyType
+from typing import List
 
-logger = logging.getLogger(__name__)
+from config import settings
+
+# Embed colors as raw ints (discord.Color.blue() etc.); Embed accepts them directly
+_COLOR_BLUE = 0x3498db
+_COLOR_GREEN = 0x2ecc71
+_COLOR_RED = 0xe74c3c
+_COLOR_PURPLE = 0x9b59b6
+_COLOR_GOLD = 0xf1c40f
+
+# Discord caps an embed at 6000 characters and 25 fields, and a message at 10 embeds
+EMBED_CHAR_LIMIT = 6000
+EMBED_FIELD_LIMIT = 25
+MESSAGE_EMBED_LIMIT = 10
+
+class _FrozenEmbed(discord.Embed):
+    """Embed whose payload is serialized once and reused on every send"""
+    __slots__ = ("_frozen_dict",)
+
+    @classmethod
+    def from_payload(cls, payload: dict) -> "_FrozenEmbed":
+        frozen = cls.from_dict(payload)
+        # Size limits are checked once here; the frozen payload never changes afterwards
+        if len(frozen) > EMBED_CHAR_LIMIT or len(frozen.fields) > EMBED_FIELD_LIMIT:
+            raise ValueError(f"Help embed '{frozen.title}' exceeds Discord embed limits")
+        frozen._frozen_dict = payload
+        return frozen
+
+    def to_dict(self):
+        try:
+            return self._frozen_dict
+        except AttributeError:
+            # copies made via Embed.copy() are ordinary, mutable embeds
+            return super().to_dict()
+
+# /help entry screen, kept as a ready-made payload for the latency-sensitive slash path
+_MAIN_EMBED_PAYLOAD = {
+    "title": "🎮 RPG Bot Help Center",
+    "description": "Welcome to the comprehensive help system! Select a category to explore:",
+    "color": _COLOR_BLUE,
+    "fields": [
+        {"name": "📚 Quick Start", "value": "New to the bot? Start here for the basics!", "inline": False},
+        {"name": "⚔️ Combat & Skills", "value": "Learn about battles, skills, and equipment", "inline": True},
+        {"name": "🏰 Guilds & Social", "value": "Guild management, parties, and PvP", "inline": True},
+        {"name": "💰 Economy & Trading", "value": "Gold, shop, crafting, and marketplace", "inline": True},
+        {"name": "🗺️ Exploration", "value": "Dungeons, quests, and adventures", "inline": True},
+        {"name": "🎯 Character & Progression", "value": "Levels, skills, achievements, and profiles", "inline": True},
+        {"name": "⚙️ Settings & Admin", "value": "Bot settings and admin commands", "inline": True},
+    ],
+}
+
+HELP_SCREENS = MappingProxyType({
+    "quickstart": (
+        "📚 Quick Start Guide",
+        "Welcome to the RPG Bot! Here's how to get started:",
+        _COLOR_GREEN,
+        (
+            ("1️⃣ Create Your Character", "`/character create` - Choose your race and class\n`/character` - View your character stats", False),
+            ("2️⃣ Start Playing", "`/play` - Access the main game menu\n`/hunt` - Start your first battle\n`/daily` - Claim daily rewards", False),
+            ("3️⃣ Explore Features", "`/shop` - Buy items and equipment\n`/inventory` - Manage your items\n`/dungeon` - Explore dungeons", False),
+            ("4️⃣ Social Features", "`/guild` - Join or create a guild\n`/party` - Form parties with friends\n`/pvp` - Challenge other players", False),
+            ("💡 Pro Tips", "• Use `/tutorial start` for an interactive guide\n• Check `/profile` to track your progress\n• Visit `/craft` to create powerful items", False),
+        ),
+    ),
+    "combat": (
+        "⚔️ Combat & Skills Guide",
+        "Master the art of battle!",
+        _COLOR_RED,
+        (
+            ("🎯 Combat Commands", "`/hunt` - Start a PvE battle\n`/pvp @user` - Challenge another player\n`/arena` - Enter the PvP arena", False),
+            ("⚡ Combat Actions", "**⚔️ Attack** - Basic attack\n**🛡️ Defend** - Reduce damage, gain SP\n**🎯 Skills** - Use special abilities\n**🧪 Items** - Consume potions/scrolls\n**🔥 Ultimate** - Powerful special move", False),
+            ("🎪 Skills System", "• Learn skills by leveling up\n• Skills cost SP (Skill Points)\n• Skills have cooldowns\n• Combo attacks for bonus damage", False),
+            ("🎒 Equipment", "`/equipment` - View/change gear\n`/equip <item>` - Equip an item\n**Weapon** - Increases attack\n**Armor** - Increases defense\n**Accessory** - Various bonuses", False),
+        ),
+    ),
+    "social": (
+        "🏰 Guilds & Social Features",
+        "Team up with other players!",
+        _COLOR_PURPLE,
+        (
+            ("🏰 Guild System", "`/guild` - Interactive guild management\n• Create or join guilds\n• Guild ranks: Owner > Officer > Member\n• Guild bonuses and shared resources", False),
+            ("👥 Party System", "`/party` - Form temporary groups\n• Team up for dungeons\n• Share rewards\n• Cooperative combat", False),
+            ("⚔️ PvP Features", "`/pvp @user` - Challenge players\n`/arena` - Ranked battles\n• Climb the leaderboards\n• Earn PvP rewards", False),
+            ("📊 Social Commands", "`/profile @user` - View player profiles\n`/leaderboard` - See top players\n`/achievements` - Track accomplishments", False),
+        ),
+    ),
+    "economy": (
+        "💰 Economy & Trading Guide",
+        "Master the art of wealth!",
+        _COLOR_GOLD,
+        (
+            ("💰 Currency System", "**Gold** - Main currency for purchases\n**XP** - Experience points for leveling\n**Reputation** - Social standing", False),
+            ("🛒 Shopping", "`/shop` - Browse items to buy\n`/daily` - Claim daily rewards\n• Weapons, armor, consumables\n• Dynamic pricing system", False),
+            ("🔨 Crafting System", "`/craft` - Interactive crafting hub\n• Learn crafting skills\n• Gather materials\n• Create powerful items\n• Upgrade equipment", False),
+            ("📦 Trading", "`/inventory` - Manage your items\n• Trade with other players\n• Auction house (coming soon)\n• Market listings", False),
+        ),
+    ),
+    "exploration": (
+        "🗺️ Exploration & Adventures",
+        "Discover the world!",
+        _COLOR_BLUE,
+        (
+            ("🏰 Dungeons", "`/dungeon` - Enter mysterious dungeons\n• Multiple floors to explore\n• Boss battles and treasures\n• Risk vs reward mechanics", False),
+            ("📜 Quests", "`/quests` - View available quests\n• Story-driven adventures\n• Daily and weekly quests\n• Epic quest chains", False),
+            ("🎁 Loot & Rewards", "• Random item drops\n• Rare equipment finds\n• Achievement unlocks\n• Experience and gold", False),
+            ("🐾 Pets & Companions", "`/pets` - Manage your companions\n• Collect different pets\n• Pet battles and training\n• Companion bonuses", False),
+        ),
+    ),
+    "commands": (
+        "📋 Complete Command List",
+        "All available commands organized by category:",
+        _COLOR_BLUE,
+        (
+            ("👤 Character", "`/character` `/character create` `/profile` `/equipment` `/equip`", False),
+            ("⚔️ Combat", "`/hunt` `/pvp` `/arena` `/challenge`", False),
+            ("💰 Economy", "`/shop` `/daily` `/inventory` `/craft`", False),
+            ("🏰 Social", "`/guild` `/party` `/leaderboard` `/achievements`", False),
+            ("🗺️ Adventure", "`/dungeon` `/quests` `/pets` `/lootbox`", False),
+            ("⚙️ Utility", "`/play` `/help` `/tutorial` `/admin_panel`", False),
+        ),
+    ),
+})
+
+def _make_embed(title: str, description: str, color: int, fields) -> discord.Embed:
+    """Build a static embed straight from its payload; static screens carry no timestamp"""
+    payload = {
+        "type": "rich",
+        "color": color,
+        "fields": [{"name": name, "value": value, "inline": inline} for name, value, inline in fields],
+    }
+    if title:
+        payload["title"] = title
+    if description:
+        payload["description"] = description
+    return _FrozenEmbed.from_payload(payload)
+
+@functools.lru_cache(maxsize=16)
+def _build(key: str) -> discord.Embed:
+    """Build a help screen from HELP_SCREENS"""
+    return _make_embed(*HELP_SCREENS[key])
+
+def _build_pages(key: str) -> List[discord.Embed]:
+    """Split a help screen into embeds that are sent together in one message"""
+    title, description, color, fields = HELP_SCREENS[key]
+    chunks = [fields[i:i + EMBED_FIELD_LIMIT] for i in range(0, len(fields), EMBED_FIELD_LIMIT)] or [[]]
+    if len(chunks) > MESSAGE_EMBED_LIMIT:
+        raise ValueError(f"Help screen '{key}' needs more than {MESSAGE_EMBED_LIMIT} embeds")
+    # Only the first embed carries the heading
+    return [
+        _make_embed(title if i == 0 else "", description if i == 0 else "", color, chunk)
+        for i, chunk in enumerate(chunks)
+    ]
+
+# Filled by _load_screen_embeds() when the cog is loaded, not at import;
+# handlers only ever see the read-only proxy
+_screen_embeds = {}
+_SCREEN_EMBEDS = MappingProxyType(_screen_embeds)
+_COMMAND_LIST_EMBEDS: List[discord.Embed] = []
+
+def _load_screen_embeds() -> None:
+    _screen_embeds.update({key: _build(key) for key in HELP_SCREENS})
+    _screen_embeds["main"] = _FrozenEmbed.from_payload(_MAIN_EMBED_PAYLOAD)
+    _COMMAND_LIST_EMBEDS[:] = _build_pages("commands")
+
+async def _show_screen(interaction: discord.Interaction, embeds: List[discord.Embed], view: discord.ui.View) -> None:
+    """Acknowledge a help click and edit the message unless it already shows this screen"""
+    await interaction.response.defer()
+    # Persistent views are shared across messages, so the message itself is the state
+    message = interaction.message
+    if message and message.embeds and message.embeds[0].title == embeds[0].title:
+        return
+    await interaction.edit_original_response(embeds=embeds, view=view)
 
 class HelpCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        # Help views hold no per-user state, so one pair serves every message
+        self.main_view = HelpMainView()
 
     @app_commands.command(name="help", description="Get help with bot commands and features")
     async def help_command(self, interaction: discord.Interaction):
         """Interactive help system"""
-        embed = create_embed(
-            title="🎮 RPG Bot Help Center",
-            description="Welcome to the comprehensive help system! Select a category to explore:",
-            color=discord.Color.blue()
-        )
-        
-        embed.add_field(
-            name="📚 Quick Start",
-            value="New to the bot? Start here for the basics!",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="⚔️ Combat & Skills",
-            value="Learn about battles, skills, and equipment",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="🏰 Guilds & Social",
-            value="Guild management, parties, and PvP",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="💰 Economy & Trading",
-            value="Gold, shop, crafting, and marketplace",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="🗺️ Exploration",
-            value="Dungeons, quests, and adventures",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="🎯 Character & Progression",
-            value="Levels, skills, achievements, and profiles",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="⚙️ Settings & Admin",
-            value="Bot settings and admin commands",
-            inline=True
-        )
-        
-        view = HelpMainView(self.bot)
-        await interaction.response.send_message(embed=embed, view=view)
+        await interaction.response.send_message(embed=_SCREEN_EMBEDS["main"], view=self.main_view, ephemeral=True)
 
 class HelpMainView(discord.ui.View):
-    def __init__(self, bot):
-        super().__init__(timeout=300.0)
-        self.bot = bot
+    def __init__(self):
+        super().__init__(timeout=None)
+        self.nav_view = HelpNavigationView(self, "main")
 
-    @discord.ui.button(label="📚 Quick Start", style=discord.ButtonStyle.primary, emoji="📚")
+    @discord.ui.button(label="📚 Quick Start", style=discord.ButtonStyle.primary, emoji="📚", custom_id="help:main:quickstart")
     async def quick_start(self, interaction: discord.Interaction, button: discord.ui.Button):
-        embed = create_embed(
-            title="📚 Quick Start Guide",
-            description="Welcome to the RPG Bot! Here's how to get started:",
-            color=discord.Color.green()
-        )
-        
-        embed.add_field(
-            name="1️⃣ Create Your Character",
-            value="`/character create` - Choose your race and class\n`/character` - View your character stats",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="2️⃣ Start Playing",
-            value="`/play` - Access the main game menu\n`/hunt` - Start your first battle\n`/daily` - Claim daily rewards",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="3️⃣ Explore Features",
-            value="`/shop` - Buy items and equipment\n`/inventory` - Manage your items\n`/dungeon` - Explore dungeons",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="4️⃣ Social Features",
-            value="`/guild` - Join or create a guild\n`/party` - Form parties with friends\n`/pvp` - Challenge other players",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="💡 Pro Tips",
-            value="• Use `/tutorial start` for an interactive guide\n• Check `/profile` to track your progress\n• Visit `/craft` to create powerful items",
-            inline=False
-        )
-        
-        view = HelpNavigationView(self.bot, "main")
-        await interaction.response.edit_message(embed=embed, view=view)
+        await _show_screen(interaction, [_SCREEN_EMBEDS["quickstart"]], self.nav_view)
 
-    @discord.ui.button(label="⚔️ Combat", style=discord.ButtonStyle.danger, emoji="⚔️")
+    @discord.ui.button(label="⚔️ Combat", style=discord.ButtonStyle.danger, emoji="⚔️", custom_id="help:main:combat")
     async def combat_help(self, interaction: discord.Interaction, button: discord.ui.Button):
-        embed = create_embed(
-            title="⚔️ Combat & Skills Guide",
-            description="Master the art of battle!",
-            color=discord.Color.red()
-        )
-        
-        embed.add_field(
-            name="🎯 Combat Commands",
-            value="`/hunt` - Start a PvE battle\n`/pvp @user` - Challenge another player\n`/arena` - Enter the PvP arena",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="⚡ Combat Actions",
-            value="**⚔️ Attack** - Basic attack\n**🛡️ Defend** - Reduce damage, gain SP\n**🎯 Skills** - Use special abilities\n**🧪 Items** - Consume potions/scrolls\n**🔥 Ultimate** - Powerful special move",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🎪 Skills System",
-            value="• Learn skills by leveling up\n• Skills cost SP (Skill Points)\n• Skills have cooldowns\n• Combo attacks for bonus damage",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🎒 Equipment",
-            value="`/equipment` - View/change gear\n`/equip <item>` - Equip an item\n**Weapon** - Increases attack\n**Armor** - Increases defense\n**Accessory** - Various bonuses",
-            inline=False
-        )
-        
-        view = HelpNavigationView(self.bot, "main")
-        await interaction.response.edit_message(embed=embed, view=view)
+        await _show_screen(interaction, [_SCREEN_EMBEDS["combat"]], self.nav_view)
 
-    @discord.ui.button(label="🏰 Social", style=discord.ButtonStyle.secondary, emoji="🏰")
+    @discord.ui.button(label="🏰 Social", style=discord.ButtonStyle.secondary, emoji="🏰", custom_id="help:main:social")
     async def social_help(self, interaction: discord.Interaction, button: discord.ui.Button):
-        embed = create_embed(
-            title="🏰 Guilds & Social Features",
-            description="Team up with other players!",
-            color=discord.Color.purple()
-        )
-        
-        embed.add_field(
-            name="🏰 Guild System",
-            value="`/guild` - Interactive guild management\n• Create or join guilds\n• Guild ranks: Owner > Officer > Member\n• Guild bonuses and shared resources",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="👥 Party System",
-            value="`/party` - Form temporary groups\n• Team up for dungeons\n• Share rewards\n• Cooperative combat",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="⚔️ PvP Features",
-            value="`/pvp @user` - Challenge players\n`/arena` - Ranked battles\n• Climb the leaderboards\n• Earn PvP rewards",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📊 Social Commands",
-            value="`/profile @user` - View player profiles\n`/leaderboard` - See top players\n`/achievements` - Track accomplishments",
-            inline=False
-        )
-        
-        view = HelpNavigationView(self.bot, "main")
-        await interaction.response.edit_message(embed=embed, view=view)
+        await _show_screen(interaction, [_SCREEN_EMBEDS["social"]], self.nav_view)
 
-    @discord.ui.button(label="💰 Economy", style=discord.ButtonStyle.success, emoji="💰")
+    @discord.ui.button(label="💰 Economy", style=discord.ButtonStyle.success, emoji="💰", custom_id="help:main:economy")
     async def economy_help(self, interaction: discord.Interaction, button: discord.ui.Button):
-        embed = create_embed(
-            title="💰 Economy & Trading Guide",
-            description="Master the art of wealth!",
-            color=discord.Color.gold()
-        )
-        
-        embed.add_field(
-            name="💰 Currency System",
-            value="**Gold** - Main currency for purchases\n**XP** - Experience points for leveling\n**Reputation** - Social standing",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🛒 Shopping",
-            value="`/shop` - Browse items to buy\n`/daily` - Claim daily rewards\n• Weapons, armor, consumables\n• Dynamic pricing system",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🔨 Crafting System",
-            value="`/craft` - Interactive crafting hub\n• Learn crafting skills\n• Gather materials\n• Create powerful items\n• Upgrade equipment",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📦 Trading",
-            value="`/inventory` - Manage your items\n• Trade with other players\n• Auction house (coming soon)\n• Market listings",
-            inline=False
-        )
-        
-        view = HelpNavigationView(self.bot, "main")
-        await interaction.response.edit_message(embed=embed, view=view)
+        await _show_screen(interaction, [_SCREEN_EMBEDS["economy"]], self.nav_view)
 
-    @discord.ui.button(label="🗺️ Exploration", style=discord.ButtonStyle.primary, emoji="🗺️")
+    @discord.ui.button(label="🗺️ Exploration", style=discord.ButtonStyle.primary, emoji="🗺️", custom_id="help:main:exploration")
     async def exploration_help(self, interaction: discord.Interaction, button: discord.ui.Button):
-        embed = create_embed(
-            title="🗺️ Exploration & Adventures",
-            description="Discover the world!",
-            color=discord.Color.blue()
-        )
-        
-        embed.add_field(
-            name="🏰 Dungeons",
-            value="`/dungeon` - Enter mysterious dungeons\n• Multiple floors to explore\n• Boss battles and treasures\n• Risk vs reward mechanics",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📜 Quests",
-            value="`/quests` - View available quests\n• Story-driven adventures\n• Daily and weekly quests\n• Epic quest chains",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🎁 Loot & Rewards",
-            value="• Random item drops\n• Rare equipment finds\n• Achievement unlocks\n• Experience and gold",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🐾 Pets & Companions",
-            value="`/pets` - Manage your companions\n• Collect different pets\n• Pet battles and training\n• Companion bonuses",
-            inline=False
-        )
-        
-        view = HelpNavigationView(self.bot, "main")
-        await interaction.response.edit_message(embed=embed, view=view)
+        await _show_screen(interaction, [_SCREEN_EMBEDS["exploration"]], self.nav_view)
 
 class HelpNavigationView(discord.ui.View):
-    def __init__(self, bot, return_to="main"):
-        super().__init__(timeout=300.0)
-        self.bot = bot
+    def __init__(self, main_view: HelpMainView, return_to="main"):
+        super().__init__(timeout=None)
+        self.main_view = main_view
         self.return_to = return_to
 
-    @discord.ui.button(label="🏠 Main Menu", style=discord.ButtonStyle.secondary, emoji="🏠")
+    @discord.ui.button(label="🏠 Main Menu", style=discord.ButtonStyle.secondary, emoji="🏠", custom_id="help:nav:main")
     async def back_to_main(self, interaction: discord.Interaction, button: discord.ui.Button):
-        embed = create_embed(
-            title="🎮 RPG Bot Help Center",
-            description="Welcome to the comprehensive help system! Select a category to explore:",
-            color=discord.Color.blue()
-        )
-        
-        embed.add_field(name="📚 Quick Start", value="New to the bot? Start here for the basics!", inline=False)
-        embed.add_field(name="⚔️ Combat & Skills", value="Learn about battles, skills, and equipment", inline=True)
-        embed.add_field(name="🏰 Guilds & Social", value="Guild management, parties, and PvP", inline=True)
-        embed.add_field(name="💰 Economy & Trading", value="Gold, shop, crafting, and marketplace", inline=True)
-        embed.add_field(name="🗺️ Exploration", value="Dungeons, quests, and adventures", inline=True)
-        embed.add_field(name="🎯 Character & Progression", value="Levels, skills, achievements, and profiles", inline=True)
-        embed.add_field(name="⚙️ Settings & Admin", value="Bot settings and admin commands", inline=True)
-        
-        view = HelpMainView(self.bot)
-        await interaction.response.edit_message(embed=embed, view=view)
+        await _show_screen(interaction, [_SCREEN_EMBEDS[self.return_to]], self.main_view)
 
-    @discord.ui.button(label="📋 Command List", style=discord.ButtonStyle.primary, emoji="📋")
+    @discord.ui.button(label="📋 Command List", style=discord.ButtonStyle.primary, emoji="📋", custom_id="help:nav:cmdlist")
     async def command_list(self, interaction: discord.Interaction, button: discord.ui.Button):
-        embed = create_embed(
-            title="📋 Complete Command List",
-            description="All available commands organized by category:",
-            color=discord.Color.blue()
-        )
-        
-        embed.add_field(
-            name="👤 Character",
-            value="`/character` `/character create` `/profile` `/equipment` `/equip`",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="⚔️ Combat",
-            value="`/hunt` `/pvp` `/arena` `/challenge`",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="💰 Economy",
-            value="`/shop` `/daily` `/inventory` `/craft`",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🏰 Social",
-            value="`/guild` `/party` `/leaderboard` `/achievements`",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🗺️ Adventure",
-            value="`/dungeon` `/quests` `/pets` `/lootbox`",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="⚙️ Utility",
-            value="`/play` `/help` `/tutorial` `/admin_panel`",
-            inline=False
-        )
-        
-        await interaction.response.edit_message(embed=embed, view=self)
+        await _show_screen(interaction, _COMMAND_LIST_EMBEDS, self)
 
 async def setup(bot):
-    await bot.add_cog(HelpCog(bot))
+    _load_screen_embeds()
+    cog = HelpCog(bot)
+    if settings.DEV_GUILD_ID:
+        # Guild-scoped commands are available immediately, without global propagation
+        await bot.add_cog(cog, guild=discord.Object(id=settings.DEV_GUILD_ID))
+    else:
+        await bot.add_cog(cog)
+    # Register the shared views so their buttons keep working across restarts
+    bot.add_view(cog.main_view)
+    bot.add_view(cog.main_view.nav_view)
@@ -1,11 +1,148 @@
 import discord
 from discord.ext import commands
 from discord import app_commands
+from utils.cache import PlayerCache
 from utils.helpers import create_embed, format_number
+from types import MappingProxyType
+from collections import Counter
+import functools
+from itertools import islice
+import heapq
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Discord can't usefully show more results than this in one category view
+SEARCH_RESULT_LIMIT = 100
+# Items shown as embed fields / dropdown options in a category view
+CATEGORY_PREVIEW_SIZE = 6
+CATEGORY_PAGE_SIZE = 25
+
+# label, emoji, style, row, bucket key, embed title, embed colour
+CATEGORY_BUTTONS = (
+    ("⚔️ Weapons", "⚔️", discord.ButtonStyle.danger, 0, "weapon", "⚔️ Weapons", discord.Color.red()),
+    ("🛡️ Armor", "🛡️", discord.ButtonStyle.primary, 0, "armor", "🛡️ Armor & Accessories", discord.Color.blue()),
+    ("🧪 Consumables", "🧪", discord.ButtonStyle.success, 0, "consumable", "🧪 Consumables", discord.Color.green()),
+    ("🔨 Materials", "🔨", discord.ButtonStyle.secondary, 0, "material", "🔨 Crafting Materials", discord.Color.orange()),
+    ("📊 All Items", "📊", discord.ButtonStyle.primary, 1, "all", "📊 All Items", discord.Color.blue()),
+    ("💎 Valuable", "💎", discord.ButtonStyle.danger, 1, "valuable", "💎 Valuable Items", discord.Color.purple()),
+)
+
+RARITY_EMOJI = MappingProxyType({
+    "common": "⚪", "uncommon": "🟢", "rare": "🔵", "epic": "🟣", "legendary": "🟡"
+})
+
+TYPE_EMOJI = MappingProxyType({
+    "Weapon": "⚔️", "Armor": "🛡️", "Accessory": "💍",
+    "Consumable": "🧪", "Material": "🔨", "consumable": "🧪",
+    "weapon": "⚔️", "armor": "🛡️", "accessory": "💍",
+    "material": "🔨", "Component": "🔨"
+})
+
+RARITY_COLOR = MappingProxyType({
+    "common": discord.Color.light_grey(), "uncommon": discord.Color.green(),
+    "rare": discord.Color.blue(), "epic": discord.Color.purple(),
+    "legendary": discord.Color.gold()
+})
+
+def _normalize_inventory(inventory: list) -> list:
+    """Store lowercased type, rarity and search fields on each item so lookups skip .lower()"""
+    for item in inventory:
+        item["_type"] = (item.get("type") or "other").lower()
+        item["_rarity"] = (item.get("rarity") or "common").lower()
+        item["_name_lc"] = item.get("name", "").lower()
+        item["_type_lc"] = item.get("type", "").lower()
+        item["_desc_lc"] = item.get("description", "").lower()
+    return inventory
+
+def _bucket_inventory(inventory: list) -> dict:
+    """Split inventory into category buckets in a single pass"""
+    weapons, armor, consumables, materials, valuable = [], [], [], [], []
+    for item in inventory:
+        item_type = item["_type"]
+        if item_type == "weapon":
+            weapons.append(item)
+        elif item_type in ("armor", "accessory"):
+            armor.append(item)
+        elif item_type in ("consumable", "potion", "scroll"):
+            consumables.append(item)
+        elif item_type in ("material", "component"):
+            materials.append(item)
+        if item.get("price", 0) > 100 or item["_rarity"] in ("rare", "epic", "legendary"):
+            valuable.append(item)
+    # Tuples so a category render can never reorder the shared inventory
+    return {
+        "weapon": tuple(weapons), "armor": tuple(armor), "consumable": tuple(consumables),
+        "material": tuple(materials), "valuable": tuple(valuable), "all": tuple(inventory)
+    }
+
+def _build_equipped_index(character: dict) -> dict:
+    """Map equipped item ids to their equipment slot"""
+    equipment = (character or {}).get("equipment", {}) or {}
+    return {eq.get("id"): slot for slot, eq in equipment.items() if eq}
+
+def _summarize_inventory(inventory: list):
+    """Return (item count, total value, quantity per type) in a single pass"""
+    total_value = 0
+    categories = Counter()
+    for item in inventory:
+        quantity = item.get("quantity", 1)
+        total_value += item.get("price", 0) * quantity
+        categories[item.get("type", "Other")] += quantity
+    return len(inventory), total_value, categories
+
+@functools.lru_cache(maxsize=256)
+def _item_embed_payload(name: str, description: str, quantity: int, price: int, item_type: str,
+                        rarity: str, effects: tuple, equipped_slot):
+    """Title, description, colour and fields for an item detail embed"""
+    fields = [
+        ("📊 Quantity", f"{quantity} items", True),
+        ("💰 Unit Value", f"{format_number(price)} gold", True),
+        ("💎 Total Value", f"{format_number(price * quantity)} gold", True),
+        ("📦 Type", item_type.title(), True),
+        ("🌟 Rarity", rarity.title(), True),
+    ]
+    
+    if equipped_slot is not None:
+        fields.append(("⚡ Status", f"✅ Equipped ({equipped_slot})", True))
+    
+    # Show item effects if available
+    effects_lines = []
+    for effect, value in effects:
+        if effect == "heal":
+            effects_lines.append(f"❤️ Heals {value} HP")
+        elif effect == "sp":
+            effects_lines.append(f"⚡ Restores {value} SP")
+        elif effect == "atk" or effect == "attack":
+            effects_lines.append(f"⚔️ +{value} Attack")
+        elif effect == "defense":
+            effects_lines.append(f"🛡️ +{value} Defense")
+        elif effect == "hp":
+            effects_lines.append(f"❤️ +{value} HP")
+        elif effect == "crit":
+            effects_lines.append(f"💥 +{value*100:.1f}% Crit")
+        else:
+            effects_lines.append(f"✨ {effect}: {value}")
+    
+    if effects_lines:
+        fields.append(("⚡ Effects", "\n".join(effects_lines), False))
+    
+    color = RARITY_COLOR.get(rarity.lower(), discord.Color.light_grey())
+    return f"📦 {name}", description, color, tuple(fields)
+
+# user_id -> (inventory, character, buckets, top items per category)
+PREPARED_CACHE_SIZE = 256
+_prepared_inventories = PlayerCache(PREPARED_CACHE_SIZE)
+
+async def _prepare_inventory(bot, user_id: int) -> tuple:
+    inventory = _normalize_inventory(await bot.inventory_system.get_inventory(user_id))
+    character = await bot.character_system.get_character(user_id)
+    return inventory, character, _bucket_inventory(inventory), {}
+
+async def _load_inventory(bot, user_id: int):
+    """Fetch and prepare a user's inventory, reusing the last result until their player data is saved again"""
+    return await _prepared_inventories.get(bot.db, user_id, lambda: _prepare_inventory(bot, user_id))
+
 class InventoryCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -15,8 +152,7 @@ class InventoryCog(commands.Cog):
         """Interactive inventory system"""
         await interaction.response.defer()
         
-        inventory = await self.bot.inventory_system.get_inventory(interaction.user.id)
-        character = await self.bot.character_system.get_character(interaction.user.id)
+        inventory, character, buckets, sorted_cache = await _load_inventory(self.bot, interaction.user.id)
         
         if not inventory:
             embed = create_embed(
@@ -27,9 +163,41 @@ class InventoryCog(commands.Cog):
             await interaction.followup.send(embed=embed)
             return
         
-        # Calculate inventory stats
-        total_items = len(inventory)
-        total_value = sum(item.get("price", 0) * item.get("quantity", 1) for item in inventory)
+        view = InventoryMainView(self.bot, interaction.user.id, inventory, character, buckets, sorted_cache)
+        await interaction.followup.send(embed=view.root_embed(), view=view)
+
+class InventoryMainView(discord.ui.View):
+    def __init__(self, bot, user_id: int, inventory: list, character: dict, buckets: dict = None, sorted_cache: dict = None):
+        super().__init__(timeout=300.0)
+        self.bot = bot
+        self.user_id = user_id
+        self.load(inventory, character, buckets, sorted_cache)
+        
+        for label, emoji, style, row, bucket, title, color in CATEGORY_BUTTONS:
+            button = discord.ui.Button(label=label, style=style, emoji=emoji, row=row)
+            button.callback = functools.partial(self._category_clicked, bucket=bucket, title=title, color=color)
+            self.add_item(button)
+        
+        search = discord.ui.Button(label="🔍 Search", style=discord.ButtonStyle.secondary, emoji="🔍", row=1)
+        search.callback = self._search_clicked
+        self.add_item(search)
+
+    def load(self, inventory: list, character: dict, buckets: dict = None, sorted_cache: dict = None):
+        """(Re)populate the view state from a normalized inventory"""
+        self.inventory = inventory
+        self.character = character
+        self.buckets = buckets if buckets is not None else _bucket_inventory(inventory)
+        self._sorted_cache = sorted_cache if sorted_cache is not None else {}
+        self._equipped_index = _build_equipped_index(character)
+        self._root_embed = None
+
+    def root_embed(self) -> discord.Embed:
+        """Inventory overview embed, built once per loaded inventory"""
+        if self._root_embed is not None:
+            return self._root_embed
+        
+        total_items, total_value, categories = _summarize_inventory(self.inventory)
+        character = self.character
         
         embed = create_embed(
             title="📦 Your Inventory",
@@ -43,21 +211,10 @@ class InventoryCog(commands.Cog):
             inline=False
         )
         
-        # Count items by category
-        categories = {}
-        for item in inventory:
-            item_type = item.get("type", "Other")
-            if item_type not in categories:
-                categories[item_type] = 0
-            categories[item_type] += item.get("quantity", 1)
-        
-        category_text = ""
-        for category, count in categories.items():
-            emoji = {"Weapon": "⚔️", "Armor": "🛡️", "Accessory": "💍", 
-                    "Consumable": "🧪", "Material": "🔨", "consumable": "🧪", 
-                    "weapon": "⚔️", "armor": "🛡️", "accessory": "💍",
-                    "material": "🔨", "Component": "🔨"}.get(category, "📦")
-            category_text += f"{emoji} **{category}:** {count} items\n"
+        category_text = "\n".join(
+            f"{TYPE_EMOJI.get(category, '📦')} **{category}:** {count} items"
+            for category, count in categories.items()
+        )
         
         embed.add_field(
             name="📊 Your Items",
@@ -65,72 +222,17 @@ class InventoryCog(commands.Cog):
             inline=False
         )
         
-        view = InventoryMainView(self.bot, interaction.user.id, inventory, character)
-        await interaction.followup.send(embed=embed, view=view)
-
-class InventoryMainView(discord.ui.View):
-    def __init__(self, bot, user_id: int, inventory: list, character: dict):
-        super().__init__(timeout=300.0)
-        self.bot = bot
-        self.user_id = user_id
-        self.inventory = inventory
-        self.character = character
-
-    @discord.ui.button(label="⚔️ Weapons", style=discord.ButtonStyle.danger, emoji="⚔️")
-    async def weapons_category(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This inventory is not yours!", ephemeral=True)
-            return
-        
-        weapons = [item for item in self.inventory if item.get("type") in ["Weapon", "weapon"]]
-        await self._show_category(interaction, "⚔️ Weapons", weapons, discord.Color.red())
-
-    @discord.ui.button(label="🛡️ Armor", style=discord.ButtonStyle.primary, emoji="🛡️")
-    async def armor_category(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This inventory is not yours!", ephemeral=True)
-            return
-        
-        armor = [item for item in self.inventory if item.get("type") in ["Armor", "armor", "Accessory", "accessory"]]
-        await self._show_category(interaction, "🛡️ Armor & Accessories", armor, discord.Color.blue())
-
-    @discord.ui.button(label="🧪 Consumables", style=discord.ButtonStyle.success, emoji="🧪")
-    async def consumables_category(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This inventory is not yours!", ephemeral=True)
-            return
-        
-        consumables = [item for item in self.inventory if item.get("type") in ["Consumable", "consumable", "potion", "scroll"]]
-        await self._show_category(interaction, "🧪 Consumables", consumables, discord.Color.green())
-
-    @discord.ui.button(label="🔨 Materials", style=discord.ButtonStyle.secondary, emoji="🔨")
-    async def materials_category(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This inventory is not yours!", ephemeral=True)
-            return
-        
-        materials = [item for item in self.inventory if item.get("type") in ["Material", "material", "Component", "component"]]
-        await self._show_category(interaction, "🔨 Crafting Materials", materials, discord.Color.orange())
-
-    @discord.ui.button(label="📊 All Items", style=discord.ButtonStyle.primary, emoji="📊", row=1)
-    async def all_items(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This inventory is not yours!", ephemeral=True)
-            return
-        
-        await self._show_category(interaction, "📊 All Items", self.inventory, discord.Color.blue())
+        self._root_embed = embed
+        return embed
 
-    @discord.ui.button(label="💎 Valuable", style=discord.ButtonStyle.danger, emoji="💎", row=1)
-    async def valuable_items(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def _category_clicked(self, interaction: discord.Interaction, bucket: str, title: str, color: discord.Color):
         if interaction.user.id != self.user_id:
             await interaction.response.send_message("This inventory is not yours!", ephemeral=True)
             return
         
-        valuable = [item for item in self.inventory if item.get("price", 0) > 100 or item.get("rarity") in ["rare", "epic", "legendary"]]
-        await self._show_category(interaction, "💎 Valuable Items", valuable, discord.Color.purple())
+        await self._show_category(interaction, title, self.buckets[bucket], color)
 
-    @discord.ui.button(label="🔍 Search", style=discord.ButtonStyle.secondary, emoji="🔍", row=1)
-    async def search_inventory(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def _search_clicked(self, interaction: discord.Interaction):
         if interaction.user.id != self.user_id:
             await interaction.response.send_message("This inventory is not yours!", ephemeral=True)
             return
@@ -138,7 +240,7 @@ class InventoryMainView(discord.ui.View):
         modal = InventorySearchModal(self.bot, self.user_id, self.inventory, self.character)
         await interaction.response.send_modal(modal)
 
-    async def _show_category(self, interaction: discord.Interaction, category_name: str, items: list, color: discord.Color):
+    async def _show_category(self, interaction: discord.Interaction, category_name: str, items: tuple, color: discord.Color):
         """Show items in a specific category"""
         if not items:
             embed = create_embed(
@@ -149,8 +251,14 @@ class InventoryMainView(discord.ui.View):
             await interaction.response.edit_message(embed=embed, view=self)
             return
         
-        # Sort by value (price * quantity)
-        items.sort(key=lambda x: x.get("price", 0) * x.get("quantity", 1), reverse=True)
+        # Only the most valuable items (price * quantity) are ever displayed, so pick those, once per category
+        top_items = self._sorted_cache.get(category_name)
+        if top_items is None:
+            top_items = heapq.nlargest(
+                max(CATEGORY_PREVIEW_SIZE, CATEGORY_PAGE_SIZE), items,
+                key=lambda x: x.get("price", 0) * x.get("quantity", 1)
+            )
+            self._sorted_cache[category_name] = top_items
         
         total_value = sum(item.get("price", 0) * item.get("quantity", 1) for item in items)
         
@@ -160,36 +268,38 @@ class InventoryMainView(discord.ui.View):
             color=color
         )
         
-        # Show first 6 items
-        items_to_show = items[:6]
-        for item in items_to_show:
-            quantity = item.get("quantity", 1)
-            price = item.get("price", 0)
-            total_item_value = price * quantity
-            rarity_emoji = {"common": "⚪", "uncommon": "🟢", "rare": "🔵", "epic": "🟣", "legendary": "🟡"}.get(item.get("rarity", "common"), "⚪")
+        # Show the top items
+        add_field = embed.add_field
+        for item in top_items[:CATEGORY_PREVIEW_SIZE]:
+            get = item.get
+            quantity = get("quantity", 1)
+            description = get("description", "No description")[:40]
+            rarity_emoji = RARITY_EMOJI.get(item["_rarity"], "⚪")
             
-            embed.add_field(
+            add_field(
                 name=f"{rarity_emoji} {item['name']} x{quantity}",
-                value=f"💰 {format_number(total_item_value)} gold\n{item.get('description', 'No description')[:40]}...",
+                value=f"💰 {format_number(get('price', 0) * quantity)} gold\n{description}...",
                 inline=True
             )
         
-        if len(items) > 6:
-            embed.set_footer(text=f"Showing 6 of {len(items)} items. Use the dropdown to manage items.")
+        if len(items) > CATEGORY_PREVIEW_SIZE:
+            embed.set_footer(text=f"Showing {CATEGORY_PREVIEW_SIZE} of {len(items)} items. Use the dropdown to manage items.")
         
-        view = InventoryCategoryView(self.bot, self.user_id, items, self.character, category_name)
+        view = InventoryCategoryView(self.bot, self.user_id, top_items, self.character, category_name, parent_view=self)
         await interaction.response.edit_message(embed=embed, view=view)
 
 class InventoryCategoryView(discord.ui.View):
-    def __init__(self, bot, user_id: int, items: list, character: dict, category_name: str):
+    def __init__(self, bot, user_id: int, items: list, character: dict, category_name: str, parent_view=None):
         super().__init__(timeout=300.0)
         self.bot = bot
         self.user_id = user_id
         self.items = items
         self.character = character
         self.category_name = category_name
+        self.parent_view = parent_view
         self.page = 0
-        self.items_per_page = 25
+        self.items_per_page = CATEGORY_PAGE_SIZE
+        self._id_index: dict = {}
         
         # Add item management dropdown
         self._add_item_dropdown()
@@ -197,26 +307,30 @@ class InventoryCategoryView(discord.ui.View):
     def _add_item_dropdown(self):
         """Add item management dropdown"""
         start_idx = self.page * self.items_per_page
-        end_idx = min(start_idx + self.items_per_page, len(self.items))
-        page_items = self.items[start_idx:end_idx]
-        
-        if not page_items:
-            return
+        page_items = islice(self.items, start_idx, start_idx + self.items_per_page)
         
         options = []
+        id_index = self._id_index
         for item in page_items:
-            quantity = item.get("quantity", 1)
-            rarity_emoji = {"common": "⚪", "uncommon": "🟢", "rare": "🔵", "epic": "🟣", "legendary": "🟡"}.get(item.get("rarity", "common"), "⚪")
+            get = item.get
+            name = item["name"]
+            item_id = get("id", name)
+            id_index.setdefault(item_id, item)
+            description = get("description", "No description")[:50]
+            rarity_emoji = RARITY_EMOJI.get(item["_rarity"], "⚪")
             
             options.append(discord.SelectOption(
-                label=f"{item['name']} x{quantity}",
-                description=f"{rarity_emoji} {item.get('description', 'No description')[:50]}",
-                value=item.get("id", item.get("name")),
+                label=f"{name} x{get('quantity', 1)}",
+                description=f"{rarity_emoji} {description}",
+                value=item_id,
                 emoji="📦"
             ))
         
+        if not options:
+            return
+        
         select = discord.ui.Select(
-            placeholder=f"📦 Select item to manage ({len(page_items)} items)",
+            placeholder=f"📦 Select item to manage ({len(options)} items)",
             options=options,
             custom_id="item_manage_select"
         )
@@ -230,14 +344,16 @@ class InventoryCategoryView(discord.ui.View):
             return
         
         item_id = interaction.data["values"][0]
-        selected_item = next((item for item in self.items if item.get("id", item.get("name")) == item_id), None)
+        selected_item = self._id_index.get(item_id)
         
         if not selected_item:
             await interaction.response.send_message("❌ Item not found!", ephemeral=True)
             return
         
         # Show item management options
-        view = InventoryItemDetailView(self.bot, self.user_id, selected_item, self.character)
+        equipped_index = self.parent_view._equipped_index if self.parent_view else None
+        view = InventoryItemDetailView(self.bot, self.user_id, selected_item, self.character,
+                                       parent_view=self.parent_view, equipped_index=equipped_index)
         embed = view.create_item_embed()
         await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
 
@@ -247,9 +363,18 @@ class InventoryCategoryView(discord.ui.View):
             await interaction.response.send_message("This inventory is not yours!", ephemeral=True)
             return
         
-        # Refresh inventory data
-        inventory = await self.bot.inventory_system.get_inventory(self.user_id)
-        character = await self.bot.character_system.get_character(self.user_id)
+        await interaction.response.defer()
+        
+        # _load_inventory hands back the same objects until the player is saved again,
+        # so the existing inventory view is reused as-is when nothing changed.
+        # A timed-out view no longer receives clicks, so it is never brought back
+        parent = self.parent_view
+        if parent is not None and parent.is_finished():
+            parent = None
+        inventory, character, buckets, sorted_cache = await _load_inventory(self.bot, self.user_id)
+        if parent is not None and inventory is parent.inventory:
+            await interaction.edit_original_response(embed=parent.root_embed(), view=parent)
+            return
         
         if not inventory:
             embed = create_embed(
@@ -257,138 +382,45 @@ class InventoryCategoryView(discord.ui.View):
                 description="Your inventory is empty!",
                 color=discord.Color.blue()
             )
-            await interaction.response.edit_message(embed=embed, view=None)
+            await interaction.edit_original_response(embed=embed, view=None)
             return
         
-        total_items = len(inventory)
-        total_value = sum(item.get("price", 0) * item.get("quantity", 1) for item in inventory)
-        
-        embed = create_embed(
-            title="📦 Your Inventory",
-            description=f"**Items:** {total_items} | **Total Value:** {format_number(total_value)} gold\n**Gold:** {format_number(character.get('gold', 0) if character else 0)}",
-            color=discord.Color.blue()
-        )
-        
-        # Update categories
-        categories = {}
-        for item in inventory:
-            item_type = item.get("type", "Other")
-            if item_type not in categories:
-                categories[item_type] = 0
-            categories[item_type] += item.get("quantity", 1)
-        
-        category_text = ""
-        for category, count in categories.items():
-            emoji = {"Weapon": "⚔️", "Armor": "🛡️", "Accessory": "💍", 
-                    "Consumable": "🧪", "Material": "🔨", "consumable": "🧪", 
-                    "weapon": "⚔️", "armor": "🛡️", "accessory": "💍",
-                    "material": "🔨", "Component": "🔨"}.get(category, "📦")
-            category_text += f"{emoji} **{category}:** {count} items\n"
-        
-        embed.add_field(
-            name="📊 Your Items",
-            value=category_text if category_text else "No items found",
-            inline=False
-        )
-        
-        view = InventoryMainView(self.bot, self.user_id, inventory, character)
-        await interaction.response.edit_message(embed=embed, view=view)
+        if parent is not None:
+            parent.load(inventory, character, buckets, sorted_cache)
+            view = parent
+        else:
+            view = InventoryMainView(self.bot, self.user_id, inventory, character, buckets, sorted_cache)
+        await interaction.edit_original_response(embed=view.root_embed(), view=view)
 
 class InventoryItemDetailView(discord.ui.View):
-    def __init__(self, bot, user_id: int, item: dict, character: dict):
+    def __init__(self, bot, user_id: int, item: dict, character: dict, parent_view=None, equipped_index: dict = None):
         super().__init__(timeout=180.0)
         self.bot = bot
         self.user_id = user_id
         self.item = item
         self.character = character
+        self.parent_view = parent_view
+        self._equipped_index = equipped_index if equipped_index is not None else _build_equipped_index(character)
 
     def create_item_embed(self):
         """Create detailed item embed"""
-        quantity = self.item.get("quantity", 1)
-        price = self.item.get("price", 0)
-        total_value = price * quantity
-        
-        rarity_color = {"common": discord.Color.light_grey(), "uncommon": discord.Color.green(), 
-                       "rare": discord.Color.blue(), "epic": discord.Color.purple(), 
-                       "legendary": discord.Color.gold()}.get(self.item.get("rarity", "common"), discord.Color.light_grey())
-        
-        embed = create_embed(
-            title=f"📦 {self.item['name']}",
-            description=self.item.get("description", "No description available."),
-            color=rarity_color
-        )
-        
-        embed.add_field(
-            name="📊 Quantity",
-            value=f"{quantity} items",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="💰 Unit Value",
-            value=f"{format_number(price)} gold",
-            inline=True
-        )
-        
-        embed.add_field(
-            name="💎 Total Value",
-            value=f"{format_number(total_value)} gold",
-            inline=True
+        item = self.item
+        effects = item.get("effects") or {}
+        args = (
+            item["name"], item.get("description", "No description available."),
+            item.get("quantity", 1), item.get("price", 0), item.get("type", "Unknown"),
+            item.get("rarity", "common"), tuple(effects.items()),
+            self._equipped_index.get(item.get("id"))
         )
-        
-        embed.add_field(
-            name="📦 Type",
-            value=self.item.get("type", "Unknown").title(),
-            inline=True
-        )
-        
-        embed.add_field(
-            name="🌟 Rarity",
-            value=self.item.get("rarity", "common").title(),
-            inline=True
-        )
-        
-        # Check if item is equipped
-        equipment = self.character.get("equipment", {})
-        is_equipped = False
-        equipped_slot = None
-        
-        for slot, equipped_item in equipment.items():
-            if equipped_item and equipped_item.get("id") == self.item.get("id"):
-                is_equipped = True
-                equipped_slot = slot
-                break
-        
-        if is_equipped:
-            embed.add_field(
-                name="⚡ Status",
-                value=f"✅ Equipped ({equipped_slot})",
-                inline=True
-            )
-        
-        # Show item effects if available
-        effects = self.item.get("effects", {})
-        if effects:
-            effects_text = ""
-            for effect, value in effects.items():
-                if effect == "heal":
-                    effects_text += f"❤️ Heals {value} HP\n"
-                elif effect == "sp":
-                    effects_text += f"⚡ Restores {value} SP\n"
-                elif effect == "atk" or effect == "attack":
-                    effects_text += f"⚔️ +{value} Attack\n"
-                elif effect == "defense":
-                    effects_text += f"🛡️ +{value} Defense\n"
-                elif effect == "hp":
-                    effects_text += f"❤️ +{value} HP\n"
-                elif effect == "crit":
-                    effects_text += f"💥 +{value*100:.1f}% Crit\n"
-                else:
-                    effects_text += f"✨ {effect}: {value}\n"
-            
-            if effects_text:
-                embed.add_field(name="⚡ Effects", value=effects_text, inline=False)
-        
+        try:
+            title, description, color, fields = _item_embed_payload(*args)
+        except TypeError:
+            # Unhashable effect values can't be cached
+            title, description, color, fields = _item_embed_payload.__wrapped__(*args)
+        
+        embed = create_embed(title=title, description=description, color=color)
+        for name, value, inline in fields:
+            embed.add_field(name=name, value=value, inline=inline)
         return embed
 
     @discord.ui.button(label="⚔️ Equip", style=discord.ButtonStyle.primary, emoji="⚔️")
@@ -397,8 +429,7 @@ class InventoryItemDetailView(discord.ui.View):
             await interaction.response.send_message("This is not your item!", ephemeral=True)
             return
         
-        item_type = self.item.get("type", "").lower()
-        if item_type not in ["weapon", "armor", "accessory"]:
+        if self.item["_type"] not in ("weapon", "armor", "accessory"):
             embed = create_embed(
                 title="❌ Cannot Equip",
                 description="This item cannot be equipped.",
@@ -407,6 +438,8 @@ class InventoryItemDetailView(discord.ui.View):
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
+        await interaction.response.defer(ephemeral=True)
+        
         # Try to equip the item
         result = await self.bot.character_system.equip_item(self.user_id, self.item.get("id", self.item.get("name")))
         
@@ -429,7 +462,7 @@ class InventoryItemDetailView(discord.ui.View):
                 color=discord.Color.red()
             )
         
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     @discord.ui.button(label="🧪 Use", style=discord.ButtonStyle.success, emoji="🧪")
     async def use_item(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -437,8 +470,7 @@ class InventoryItemDetailView(discord.ui.View):
             await interaction.response.send_message("This is not your item!", ephemeral=True)
             return
         
-        item_type = self.item.get("type", "").lower()
-        if item_type not in ["consumable", "potion", "scroll"]:
+        if self.item["_type"] not in ("consumable", "potion", "scroll"):
             embed = create_embed(
                 title="❌ Cannot Use",
                 description="This item cannot be used outside of combat.",
@@ -447,35 +479,24 @@ class InventoryItemDetailView(discord.ui.View):
             await interaction.response.send_message(embed=embed, ephemeral=True)
             return
         
-        # Use the item (apply effects and consume)
+        await interaction.response.defer(ephemeral=True)
+        
+        # Use the item (apply effects and consume in one write)
         effects = self.item.get("effects", {})
-        character = await self.bot.character_system.get_character(self.user_id)
+        result = await self.bot.inventory_system.use_and_apply(
+            self.user_id, self.item.get("id", self.item.get("name")),
+            hp_delta=effects.get("heal", 0), sp_delta=effects.get("sp", 0)
+        )
         
-        if not character:
-            await interaction.response.send_message("❌ Character not found!", ephemeral=True)
+        if not result.get("success"):
+            await interaction.followup.send(f"❌ {result.get('message', 'Failed to use item.')}", ephemeral=True)
             return
         
-        # Apply effects
         effects_applied = []
         if "heal" in effects:
-            heal_amount = effects["heal"]
-            current_hp = character.get("hp", character.get("max_hp", 100))
-            max_hp = character.get("max_hp", 100)
-            new_hp = min(current_hp + heal_amount, max_hp)
-            character["hp"] = new_hp
-            effects_applied.append(f"❤️ Healed {new_hp - current_hp} HP")
-        
+            effects_applied.append(f"❤️ Healed {result['hp_restored']} HP")
         if "sp" in effects:
-            sp_amount = effects["sp"]
-            current_sp = character.get("sp", character.get("max_sp", 50))
-            max_sp = character.get("max_sp", 50)
-            new_sp = min(current_sp + sp_amount, max_sp)
-            character["sp"] = new_sp
-            effects_applied.append(f"⚡ Restored {new_sp - current_sp} SP")
-        
-        # Consume the item
-        await self.bot.inventory_system.consume_item(self.user_id, self.item.get("id", self.item.get("name")), 1)
-        await self.bot.db.save_player(self.user_id, character)
+            effects_applied.append(f"⚡ Restored {result['sp_restored']} SP")
         
         embed = create_embed(
             title="✅ Item Used!",
@@ -490,7 +511,7 @@ class InventoryItemDetailView(discord.ui.View):
                 inline=False
             )
         
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
     @discord.ui.button(label="💰 Sell", style=discord.ButtonStyle.danger, emoji="💰")
     async def sell_item(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -498,7 +519,7 @@ class InventoryItemDetailView(discord.ui.View):
             await interaction.response.send_message("This is not your item!", ephemeral=True)
             return
         
-        modal = InventorySellModal(self.bot, self.user_id, self.item)
+        modal = InventorySellModal(self.bot, self.user_id, self.item, parent_view=self.parent_view)
         await interaction.response.send_modal(modal)
 
 class InventorySearchModal(discord.ui.Modal):
@@ -517,15 +538,15 @@ class InventorySearchModal(discord.ui.Modal):
     )
 
     async def on_submit(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
         search = self.search_term.value.lower()
         
-        # Search through inventory
-        matching_items = []
-        for item in self.inventory:
-            if (search in item.get("name", "").lower() or 
-                search in item.get("type", "").lower() or 
-                search in item.get("description", "").lower()):
-                matching_items.append(item)
+        # Search through inventory, stopping once the result limit is reached
+        matching_items = list(islice(
+            (item for item in self.inventory
+             if search in item["_name_lc"] or search in item["_type_lc"] or search in item["_desc_lc"]),
+            SEARCH_RESULT_LIMIT
+        ))
         
         if not matching_items:
             embed = create_embed(
@@ -533,7 +554,7 @@ class InventorySearchModal(discord.ui.Modal):
                 description=f"No items found matching '{self.search_term.value}'.",
                 color=discord.Color.red()
             )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=embed, ephemeral=True)
             return
         
         # Show search results
@@ -544,14 +565,15 @@ class InventorySearchModal(discord.ui.Modal):
             color=discord.Color.blue()
         )
         
-        await interaction.response.send_message(embed=embed, view=view, ephemeral=True)
+        await interaction.followup.send(embed=embed, view=view, ephemeral=True)
 
 class InventorySellModal(discord.ui.Modal):
-    def __init__(self, bot, user_id: int, item: dict):
+    def __init__(self, bot, user_id: int, item: dict, parent_view=None):
         super().__init__(title=f"Sell {item['name']}")
         self.bot = bot
         self.user_id = user_id
         self.item = item
+        self.parent_view = parent_view
 
     quantity = discord.ui.TextInput(
         label="Quantity to Sell",
@@ -561,6 +583,7 @@ class InventorySellModal(discord.ui.Modal):
     )
 
     async def on_submit(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
         try:
             qty = int(self.quantity.value)
             if qty <= 0:
@@ -576,7 +599,7 @@ class InventorySellModal(discord.ui.Modal):
                 description="Please enter a valid positive number.",
                 color=discord.Color.red()
             )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+            await interaction.followup.send(embed=embed, ephemeral=True)
             return
         
         # Calculate sell price (50% of buy price)
@@ -584,14 +607,18 @@ class InventorySellModal(discord.ui.Modal):
         sell_price = max(1, unit_price // 2)
         total_gold = sell_price * qty
         
-        # Process sale
-        character = await self.bot.character_system.get_character(self.user_id)
-        if character:
-            character["gold"] = character.get("gold", 0) + total_gold
-            await self.bot.db.save_player(self.user_id, character)
-        
-        # Remove items from inventory
-        await self.bot.inventory_system.consume_item(self.user_id, self.item.get("id", self.item.get("name")), qty)
+        # Process sale: remove items and credit gold in one write
+        result = await self.bot.inventory_system.sell_item(
+            self.user_id, self.item.get("id", self.item.get("name")), qty, total_gold
+        )
+        if not result.get("success"):
+            embed = create_embed(
+                title="❌ Sale Failed",
+                description=result.get("message", "Failed to sell item."),
+                color=discord.Color.red()
+            )
+            await interaction.followup.send(embed=embed, ephemeral=True)
+            return
         
         embed = create_embed(
             title="✅ Items Sold!",
@@ -604,7 +631,7 @@ class InventorySellModal(discord.ui.Modal):
             inline=True
         )
         
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        await interaction.followup.send(embed=embed, ephemeral=True)
 
 async def setup(bot):
     await bot.add_cog(InventoryCog(bot))
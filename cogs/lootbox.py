@@ -1,17 +1,66 @@
+import asyncio
 import random
+import time
+from collections import deque
+from datetime import datetime
 import discord
 from discord.ext import commands
 from discord import app_commands
 
+from utils.cache import TTLCache
 from utils.helpers import create_embed, get_rarity_color, get_rarity_emoji
 
+ITEMS_CACHE_TTL = 60.0
+_items_cache = TTLCache(ITEMS_CACHE_TTL)
+
+# Simple rarity distribution: 60% / 20% / 12% / 6% / 2%
+TIER_NAMES = ("Common", "Uncommon", "Rare", "Epic", "Legendary")
+TIER_CUM = (0.6, 0.8, 0.92, 0.98, 1.0)
+
+# Rarities are drawn in batches and handed out one roll at a time
+RARITY_BATCH = 1024
+_rarity_buffer: deque = deque()
+
+def _next_rarity() -> str:
+    if not _rarity_buffer:
+        _rarity_buffer.extend(random.choices(TIER_NAMES, cum_weights=TIER_CUM, k=RARITY_BATCH))
+    return _rarity_buffer.popleft()
+
+# Clicks arriving this soon after a roll are treated as double-clicks
+ROLL_DEBOUNCE = 0.25
+
+def _index_by_rarity(items_data: dict) -> dict:
+    """Group item ids by lowercased rarity; "_all" holds every id"""
+    index = {"_all": list(items_data.keys())}
+    for iid, it in items_data.items():
+        if isinstance(it, dict):
+            index.setdefault(it.get("rarity", "Common").lower(), []).append(iid)
+    return index
+
+async def _load_items(bot) -> tuple:
+    items_data = await bot.db.load_items()
+    return items_data, _index_by_rarity(items_data)
+
+async def _get_items_cached(bot):
+    """Item definitions and their rarity index, reloaded at most once per ITEMS_CACHE_TTL"""
+    return await _items_cache.get("items", lambda: _load_items(bot))
+
 class LootboxView(discord.ui.View):
+    __slots__ = ("bot", "user_id", "box_item_id", "last_roll", "_lock", "_last_roll_at", "_embed")
+
     def __init__(self, bot, user_id: int, box_item_id: str, timeout: float = 120.0):
         super().__init__(timeout=timeout)
         self.bot = bot
         self.user_id = user_id
         self.box_item_id = box_item_id
         self.last_roll = None
+        self._lock = asyncio.Lock()
+        self._last_roll_at = 0.0
+        # Reveal embed, updated in place by each roll
+        self._embed = create_embed(fields=[{"name": "Rarity", "value": "", "inline": True}])
+
+    def _busy(self) -> bool:
+        return self._lock.locked() or time.monotonic() - self._last_roll_at < ROLL_DEBOUNCE
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         if interaction.user.id != self.user_id:
@@ -21,57 +70,51 @@ class LootboxView(discord.ui.View):
 
     @discord.ui.button(label="Open", style=discord.ButtonStyle.success, emoji="🎁")
     async def open(self, interaction: discord.Interaction, button: discord.ui.Button):
-        await self._roll(interaction)
+        if self._busy():
+            await interaction.response.defer()
+            return
+        async with self._lock:
+            # The box was consumed once, so it can only be opened once
+            button.disabled = True
+            await self._roll(interaction)
 
     @discord.ui.button(label="Reroll (200g)", style=discord.ButtonStyle.secondary, emoji="🔄")
     async def reroll(self, interaction: discord.Interaction, button: discord.ui.Button):
-        # Charge gold
-        char = await self.bot.character_system.get_character(self.user_id)
-        if char.get("gold", 0) < 200:
-            await interaction.response.send_message("Not enough gold to reroll.", ephemeral=True)
+        await interaction.response.defer()
+        if self._busy():
             return
-        await self.bot.character_system.spend_gold(self.user_id, 200)
-        await self._roll(interaction)
+        async with self._lock:
+            # Charge gold (warm the items cache for the roll meanwhile)
+            char, _ = await asyncio.gather(
+                self.bot.character_system.get_character(self.user_id),
+                _get_items_cached(self.bot),
+            )
+            if char.get("gold", 0) < 200:
+                await interaction.followup.send("Not enough gold to reroll.", ephemeral=True)
+                return
+            await self.bot.character_system.spend_gold(self.user_id, 200)
+            await self._roll(interaction)
 
     async def _roll(self, interaction: discord.Interaction):
-        # Simple rarity distribution
-        tiers = [
-            ("Common", 0.6),
-            ("Uncommon", 0.2),
-            ("Rare", 0.12),
-            ("Epic", 0.06),
-            ("Legendary", 0.02),
-        ]
-        pick = random.random()
-        acc = 0.0
-        rarity = "Common"
-        for r, p in tiers:
-            acc += p
-            if pick <= acc:
-                rarity = r
-                break
+        if not interaction.response.is_done():
+            await interaction.response.defer()
+        rarity = _next_rarity()
         # Pick a random item matching rarity from items.json (fallback to any)
-        items_data = await self.bot.db.load_items()
-        pool = [iid for iid, it in items_data.items() if isinstance(it, dict) and it.get("rarity", "Common").lower() == rarity.lower()]
-        if not pool:
-            pool = list(items_data.keys())
+        items_data, by_rarity = await _get_items_cached(self.bot)
+        pool = by_rarity.get(rarity.lower()) or by_rarity["_all"]
         item_id = random.choice(pool)
         item = items_data.get(item_id, {"name": item_id, "description": ""})
         # Grant the item
         await self.bot.inventory_system.add_item(self.user_id, item_id, 1)
         # Reveal embed
-        emoji = get_rarity_emoji(rarity)
-        color = get_rarity_color(rarity)
-        embed = create_embed(
-            title=f"{emoji} You received: {item.get('name', item_id)}",
-            description=item.get("description", ""),
-            color=color,
-            fields=[{"name": "Rarity", "value": rarity, "inline": True}],
-        )
-        if interaction.response.is_done():
-            await interaction.edit_original_response(embed=embed, view=self)
-        else:
-            await interaction.response.edit_message(embed=embed, view=self)
+        embed = self._embed
+        embed.title = f"{get_rarity_emoji(rarity)} You received: {item.get('name', item_id)}"
+        embed.description = item.get("description", "")
+        embed.color = get_rarity_color(rarity)
+        embed.timestamp = datetime.utcnow()
+        embed.set_field_at(0, name="Rarity", value=rarity, inline=True)
+        self._last_roll_at = time.monotonic()
+        await interaction.edit_original_response(embed=embed, view=self)
 
 class LootboxCog(commands.Cog):
     def __init__(self, bot):
@@ -81,19 +124,27 @@ class LootboxCog(commands.Cog):
     @app_commands.describe(box_item_id="The ID of the lootbox item to open (e.g., basic_lootbox)")
     async def lootbox(self, interaction: discord.Interaction, box_item_id: str):
         user_id = interaction.user.id
-        char = await self.bot.character_system.get_character(user_id)
+        
+        # Acknowledge early to avoid token expiry
+        try:
+            await interaction.response.defer()
+        except Exception:
+            pass
+        
+        char, count = await asyncio.gather(
+            self.bot.character_system.get_character(user_id),
+            self.bot.inventory_system.count_item(user_id, box_item_id),
+        )
         if not char:
-            await interaction.response.send_message(embed=create_embed(title="❌ No Character", description="Create a character first with /character create", color=discord.Color.red()))
+            await interaction.followup.send(embed=create_embed(title="❌ No Character", description="Create a character first with /character create", color=discord.Color.red()))
             return
         # Ensure player has the lootbox item and consume one
-        inv = await self.bot.inventory_system.get_inventory(user_id)
-        count = sum(1 for it in inv if it.get("id") == box_item_id for _ in range(it.get("quantity", 0)))
         if count <= 0:
-            await interaction.response.send_message(embed=create_embed(title="🎁 No Lootboxes", description=f"You don't have `{box_item_id}`.", color=discord.Color.orange()))
+            await interaction.followup.send(embed=create_embed(title="🎁 No Lootboxes", description=f"You don't have `{box_item_id}`.", color=discord.Color.orange()))
             return
         await self.bot.inventory_system.remove_item(user_id, box_item_id, 1)
         # Send interactive view
-        await interaction.response.send_message(embed=create_embed(title="🎁 Lootbox", description="Press Open to reveal your reward!", color=discord.Color.gold()), view=LootboxView(self.bot, user_id, box_item_id))
+        await interaction.followup.send(embed=create_embed(title="🎁 Lootbox", description="Press Open to reveal your reward!", color=discord.Color.gold()), view=LootboxView(self.bot, user_id, box_item_id))
 
 async def setup(bot):
     await bot.add_cog(LootboxCog(bot))
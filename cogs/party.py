@@ -3,6 +3,9 @@
 Ultra-low latency party management commands
 """
 
+import asyncio
+import time
+from itertools import islice
 import discord
 from discord.ext import commands
 from discord import app_commands
@@ -13,9 +16,64 @@ from utils.helpers import create_embed
 
 logger = logging.getLogger(__name__)
 
+# How long a PartyView trusts its last party lookup
+PARTY_CACHE_TTL = 5.0
+
+# guild_id -> invite SelectOptions, dropped whenever the guild's member list changes
+_invite_options: dict = {}
+
+_PARTY_FEATURES_VALUE = (
+    "• Create parties with up to 4 players\n"
+    "• Shared XP and loot distribution\n"
+    "• Cooperative combat with scaled monsters\n"
+    "• Party settings and management"
+)
+
+# party_id -> (party _embed_version, info embed)
+_party_info_embeds: dict = {}
+PARTY_INFO_CACHE_SIZE = 256
+
+def _party_info_embed(party: dict) -> discord.Embed:
+    """Party info embed, rebuilt only when the party system reports a change"""
+    party_id = party["party_id"]
+    version = party.get("_embed_version", 0)
+    cached = _party_info_embeds.get(party_id)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    
+    member_count = party.get("member_count")
+    if member_count is None:
+        member_count = len(party["members"])
+    settings = party["settings"]
+    emb = create_embed(title=f"📊 {party['name']}", description="Party information and settings", color=discord.Color.blue())
+    emb.add_field(name="👥 Members", value=f"**{member_count}/{party['max_members']}** members", inline=True)
+    emb.add_field(name="⚙️ Settings", value=f"**XP Split:** {settings['xp_split']}\n**Loot Split:** {settings['loot_split']}", inline=True)
+    # Reused across clicks, so a build-time timestamp would only go stale
+    emb.timestamp = None
+    
+    if party_id not in _party_info_embeds and len(_party_info_embeds) >= PARTY_INFO_CACHE_SIZE:
+        _party_info_embeds.pop(next(iter(_party_info_embeds)))
+    _party_info_embeds[party_id] = (version, emb)
+    return emb
+
+def _guild_invite_options(guild: discord.Guild) -> list:
+    """Invite candidates for a guild, built once per member-list change"""
+    options = _invite_options.get(guild.id)
+    if options is None:
+        # One spare candidate so there are still 25 after the inviter is filtered out
+        candidates = (m for m in guild.members if not m.bot)
+        options = [
+            discord.SelectOption(label=m.display_name, value=str(m.id))
+            for m in islice(candidates, 26)
+        ]
+        _invite_options[guild.id] = options
+    return options
+
 class PartyCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        # Quick actions act on whoever clicks, so one view serves every message
+        self.already_in_view = PartyAlreadyInView(bot)
 
     @app_commands.command(name="party", description="👥 Party Management")
     async def party(self, interaction: discord.Interaction):
@@ -28,40 +86,37 @@ class PartyCog(commands.Cog):
         except Exception:
             pass
         
-        # Check if character exists
-        character = await self.bot.character_system.get_character(user_id)
+        # Check if character exists (and look up their party meanwhile)
+        character, current_party = await asyncio.gather(
+            self.bot.character_system.get_character(user_id),
+            self.bot.party_system.get_player_party(user_id),
+        )
         if not character:
             await interaction.followup.send("You need to create a character first! Use `/character`", ephemeral=True)
             return
         
         # Show party interface
         embed = self._create_party_embed(character)
-        current_party = await self.bot.party_system.get_player_party(user_id)
         if current_party:
             # Offer quick actions
-            v = discord.ui.View()
-            info = discord.ui.Button(label="View Info", style=discord.ButtonStyle.secondary, emoji="📊")
-            leave = discord.ui.Button(label="Leave Party", style=discord.ButtonStyle.danger, emoji="🚪")
-            async def info_cb(i: discord.Interaction):
-                if i.user.id != user_id: return await i.response.send_message("Not for you", ephemeral=True)
-                emb = create_embed(title=f"📊 {current_party['name']}", description="Party information and settings", color=discord.Color.blue())
-                emb.add_field(name="👥 Members", value=f"**{len(current_party['members'])}/{current_party['max_members']}** members", inline=True)
-                emb.add_field(name="⚙️ Settings", value=f"**XP Split:** {current_party['settings']['xp_split']}\n**Loot Split:** {current_party['settings']['loot_split']}", inline=True)
-                await i.response.edit_message(embed=emb, view=None)
-            async def leave_cb(i: discord.Interaction):
-                if i.user.id != user_id: return await i.response.send_message("Not for you", ephemeral=True)
-                res = await self.bot.party_system.leave_party(user_id)
-                if res.get("success"):
-                    await i.response.edit_message(embed=create_embed(title="👋 Left Party", description=res.get("message",""), color=discord.Color.orange()), view=None)
-                else:
-                    await i.response.send_message(res.get("message","Failed"), ephemeral=True)
-            info.callback = info_cb; leave.callback = leave_cb
-            v.add_item(info); v.add_item(leave)
-            await interaction.followup.send(create_embed(title="⚠️ Already in a Party", description="You are already in a party. Manage it below.", color=discord.Color.orange()), view=v)
+            await interaction.followup.send(embed=create_embed(title="⚠️ Already in a Party", description="You are already in a party. Manage it below.", color=discord.Color.orange()), view=self.already_in_view)
             return
         view = PartyView(self.bot, user_id, in_party=False)
         await interaction.followup.send(embed=embed, view=view)
 
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        _invite_options.pop(member.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_member_remove(self, member: discord.Member):
+        _invite_options.pop(member.guild.id, None)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before.display_name != after.display_name:
+            _invite_options.pop(after.guild.id, None)
+
     def _create_party_embed(self, character):
         """Create party status embed"""
         embed = create_embed(
@@ -70,20 +125,54 @@ class PartyCog(commands.Cog):
             color=discord.Color.blue()
         )
         
-        embed.add_field(
-            name="🎯 Party Features",
-            value="• Create parties with up to 4 players\n• Shared XP and loot distribution\n• Cooperative combat with scaled monsters\n• Party settings and management",
-            inline=False
-        )
+        embed.add_field(name="🎯 Party Features", value=_PARTY_FEATURES_VALUE, inline=False)
         
         return embed
 
+def _invoker_id(message: Optional[discord.Message]) -> Optional[int]:
+    """Id of the user whose slash command produced the message, if known"""
+    if message is None:
+        return None
+    meta = getattr(message, "interaction_metadata", None) or message.interaction
+    return meta.user.id if meta else None
+
+class PartyAlreadyInView(discord.ui.View):
+    def __init__(self, bot):
+        super().__init__(timeout=None)
+        self.bot = bot
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        owner_id = _invoker_id(interaction.message)
+        if owner_id is not None and interaction.user.id != owner_id:
+            await interaction.response.send_message("Not for you", ephemeral=True)
+            return False
+        return True
+
+    @discord.ui.button(label="View Info", style=discord.ButtonStyle.secondary, emoji="📊", custom_id="party:info")
+    async def info(self, interaction: discord.Interaction, button: discord.ui.Button):
+        current_party = await self.bot.party_system.get_player_party(interaction.user.id)
+        if not current_party:
+            await interaction.response.send_message("You are not in a party!", ephemeral=True)
+            return
+        await interaction.response.edit_message(embed=_party_info_embed(current_party), view=None)
+
+    @discord.ui.button(label="Leave Party", style=discord.ButtonStyle.danger, emoji="🚪", custom_id="party:leave")
+    async def leave(self, interaction: discord.Interaction, button: discord.ui.Button):
+        res = await self.bot.party_system.leave_party(interaction.user.id)
+        if res.get("success"):
+            await interaction.response.edit_message(embed=create_embed(title="👋 Left Party", description=res.get("message",""), color=discord.Color.orange()), view=None)
+        else:
+            await interaction.response.send_message(res.get("message","Failed"), ephemeral=True)
+
 class PartyView(discord.ui.View):
+    __slots__ = ("bot", "user_id", "in_party", "_party_cache")
+
     def __init__(self, bot, user_id: int, in_party: bool):
         super().__init__(timeout=300.0)
         self.bot = bot
         self.user_id = user_id
         self.in_party = in_party
+        self._party_cache = (0.0, None)
         if not in_party:
             self.add_item(self._make_create_button())
         else:
@@ -91,124 +180,152 @@ class PartyView(discord.ui.View):
             self.add_item(self._make_start_combat_button())
             self.add_item(self._make_info_button())
 
+    async def _party(self) -> Optional[dict]:
+        """Current party of the view owner, reused for PARTY_CACHE_TTL seconds"""
+        fetched_at, party = self._party_cache
+        if time.monotonic() - fetched_at < PARTY_CACHE_TTL:
+            return party
+        party = await self.bot.party_system.get_player_party(self.user_id)
+        self._party_cache = (time.monotonic(), party)
+        return party
+
+    def _invalidate_party(self):
+        self._party_cache = (0.0, None)
+
     def _make_create_button(self) -> discord.ui.Button:
         btn = discord.ui.Button(label="🏗️ Create Party", style=discord.ButtonStyle.primary, emoji="🏗️")
-        async def on_click(interaction: discord.Interaction):
-            if interaction.user.id != self.user_id:
-                await interaction.response.send_message("This is not for you!", ephemeral=True)
-                return
-            current_party = await self.bot.party_system.get_player_party(self.user_id)
-            if current_party:
-                await interaction.response.send_message("You are already in a party!", ephemeral=True)
-                return
-            result = await self.bot.party_system.create_party(self.user_id)
-            if result["success"]:
-                emb = create_embed(title="🎉 Party Created!", description=result["message"], color=discord.Color.green())
-                emb.add_field(name="Party Name", value=result["party"]["name"], inline=False)
-                emb.add_field(name="Members", value=f"1/{result['party']['max_members']}", inline=True)
-                await interaction.response.edit_message(embed=emb, view=None)
-            else:
-                await interaction.response.send_message(f"❌ Failed to create party: {result['message']}", ephemeral=True)
-        btn.callback = on_click
+        btn.callback = self._on_create_click
         return btn
 
+    async def _on_create_click(self, interaction: discord.Interaction):
+        if interaction.user.id != self.user_id:
+            await interaction.response.send_message("This is not for you!", ephemeral=True)
+            return
+        current_party = await self._party()
+        if current_party:
+            await interaction.response.send_message("You are already in a party!", ephemeral=True)
+            return
+        result = await self.bot.party_system.create_party(self.user_id)
+        if result["success"]:
+            self._invalidate_party()
+            emb = create_embed(title="🎉 Party Created!", description=result["message"], color=discord.Color.green())
+            emb.add_field(name="Party Name", value=result["party"]["name"], inline=False)
+            emb.add_field(name="Members", value=f"1/{result['party']['max_members']}", inline=True)
+            await interaction.response.edit_message(embed=emb, view=None)
+        else:
+            await interaction.response.send_message(f"❌ Failed to create party: {result['message']}", ephemeral=True)
+
     def _make_invite_button(self) -> discord.ui.Button:
         btn = discord.ui.Button(label="📨 Invite Player", style=discord.ButtonStyle.success, emoji="📨")
-        async def on_click(interaction: discord.Interaction):
-            if interaction.user.id != self.user_id:
-                await interaction.response.send_message("This is not for you!", ephemeral=True)
-                return
-            current_party = await self.bot.party_system.get_player_party(self.user_id)
-            if not current_party:
-                await interaction.response.send_message("You must be in a party to invite players!", ephemeral=True)
-                return
-            if current_party["leader_id"] != self.user_id:
-                await interaction.response.send_message("Only the party leader can invite players!", ephemeral=True)
-                return
-            # Build member select from guild
-            if not interaction.guild:
-                await interaction.response.send_message("Invites require a guild (server) context.", ephemeral=True)
-                return
-            options = []
-            for m in interaction.guild.members[:25]:
-                if m.bot or m.id == self.user_id: continue
-                options.append(discord.SelectOption(label=m.display_name, value=str(m.id)))
-            if not options:
-                await interaction.response.send_message("No members to invite.", ephemeral=True)
-                return
-            select = discord.ui.Select(placeholder="Select a member to invite...", min_values=1, max_values=1, options=options)
-            async def select_cb(i: discord.Interaction):
-                if i.user.id != self.user_id:
-                    await i.response.send_message("This is not for you!", ephemeral=True)
-                    return
-                target_id = int(select.values[0])
-                res = await self.bot.party_system.invite_player(self.user_id, target_id)
-                if res["success"]:
-                    invite_id = res["invite_id"]
-                    # Post accept button for target
-                    accept_view = PartyInviteAcceptView(self.bot, invite_id, target_id)
-                    await i.response.send_message(f"📨 Invite sent to <@{target_id}>.", ephemeral=True)
-                    await interaction.followup.send(content=f"<@{target_id}> you have been invited to a party.", view=accept_view)
-                else:
-                    await i.response.send_message(f"❌ {res['message']}", ephemeral=True)
-            select.callback = select_cb
-            v = discord.ui.View(); v.add_item(select)
-            await interaction.response.send_message("Pick a member:", view=v, ephemeral=True)
-        btn.callback = on_click
+        btn.callback = self._on_invite_click
         return btn
 
+    async def _on_invite_click(self, interaction: discord.Interaction):
+        if interaction.user.id != self.user_id:
+            await interaction.response.send_message("This is not for you!", ephemeral=True)
+            return
+        current_party = await self._party()
+        if not current_party:
+            await interaction.response.send_message("You must be in a party to invite players!", ephemeral=True)
+            return
+        if current_party["leader_id"] != self.user_id:
+            await interaction.response.send_message("Only the party leader can invite players!", ephemeral=True)
+            return
+        # Build member select from guild
+        if not interaction.guild:
+            await interaction.response.send_message("Invites require a guild (server) context.", ephemeral=True)
+            return
+        own_id = str(self.user_id)
+        options = list(islice((o for o in _guild_invite_options(interaction.guild) if o.value != own_id), 25))
+        if not options:
+            await interaction.response.send_message("No members to invite.", ephemeral=True)
+            return
+        select = discord.ui.Select(placeholder="Select a member to invite...", min_values=1, max_values=1, options=options)
+        async def select_cb(i: discord.Interaction):
+            if i.user.id != self.user_id:
+                await i.response.send_message("This is not for you!", ephemeral=True)
+                return
+            target_id = int(select.values[0])
+            res = await self.bot.party_system.invite_player(self.user_id, target_id)
+            if res["success"]:
+                self._invalidate_party()
+                invite_id = res["invite_id"]
+                # Post accept button for target
+                accept_view = PartyInviteAcceptView(invite_id)
+                await i.response.send_message(f"📨 Invite sent to <@{target_id}>.", ephemeral=True)
+                await interaction.followup.send(content=f"<@{target_id}> you have been invited to a party.", view=accept_view)
+            else:
+                await i.response.send_message(f"❌ {res['message']}", ephemeral=True)
+        select.callback = select_cb
+        v = discord.ui.View(); v.add_item(select)
+        await interaction.response.send_message("Pick a member:", view=v, ephemeral=True)
+
     def _make_start_combat_button(self) -> discord.ui.Button:
         btn = discord.ui.Button(label="⚔️ Start Combat", style=discord.ButtonStyle.danger, emoji="⚔️")
-        async def on_click(interaction: discord.Interaction):
-            if interaction.user.id != self.user_id:
-                await interaction.response.send_message("This is not for you!", ephemeral=True)
-                return
-            current_party = await self.bot.party_system.get_player_party(self.user_id)
-            if not current_party:
-                await interaction.response.send_message("You must be in a party to start combat!", ephemeral=True)
-                return
-            await interaction.response.send_message("⚔️ Party combat coming soon.", ephemeral=True)
-        btn.callback = on_click
+        btn.callback = self._on_start_combat_click
         return btn
 
+    async def _on_start_combat_click(self, interaction: discord.Interaction):
+        if interaction.user.id != self.user_id:
+            await interaction.response.send_message("This is not for you!", ephemeral=True)
+            return
+        current_party = await self._party()
+        if not current_party:
+            await interaction.response.send_message("You must be in a party to start combat!", ephemeral=True)
+            return
+        await interaction.response.send_message("⚔️ Party combat coming soon.", ephemeral=True)
+
     def _make_info_button(self) -> discord.ui.Button:
         btn = discord.ui.Button(label="📊 Party Info", style=discord.ButtonStyle.secondary, emoji="📊")
-        async def on_click(interaction: discord.Interaction):
-            if interaction.user.id != self.user_id:
-                await interaction.response.send_message("This is not for you!", ephemeral=True)
-                return
-            current_party = await self.bot.party_system.get_player_party(self.user_id)
-            if not current_party:
-                await interaction.response.send_message("You are not in a party!", ephemeral=True)
-                return
-            emb = create_embed(title=f"📊 {current_party['name']}", description="Party information and settings", color=discord.Color.blue())
-            emb.add_field(name="👥 Members", value=f"**{len(current_party['members'])}/{current_party['max_members']}** members", inline=True)
-            emb.add_field(name="⚙️ Settings", value=f"**XP Split:** {current_party['settings']['xp_split']}\n**Loot Split:** {current_party['settings']['loot_split']}", inline=True)
-            await interaction.response.send_message(embed=emb, ephemeral=True)
-        btn.callback = on_click
+        btn.callback = self._on_info_click
         return btn
 
-class PartyInviteAcceptView(discord.ui.View):
-    def __init__(self, bot, invite_id: str, target_id: int):
-        super().__init__(timeout=300.0)
-        self.bot = bot
+    async def _on_info_click(self, interaction: discord.Interaction):
+        if interaction.user.id != self.user_id:
+            await interaction.response.send_message("This is not for you!", ephemeral=True)
+            return
+        current_party = await self._party()
+        if not current_party:
+            await interaction.response.send_message("You are not in a party!", ephemeral=True)
+            return
+        await interaction.response.send_message(embed=_party_info_embed(current_party), ephemeral=True)
+
+class PartyInviteAcceptButton(discord.ui.DynamicItem[discord.ui.Button], template=r"party:accept:(?P<invite_id>\w+)"):
+    """Accept button for any invite; the invite id travels in the custom_id"""
+
+    def __init__(self, invite_id: str):
+        super().__init__(discord.ui.Button(label="✅ Accept Invite", style=discord.ButtonStyle.success, emoji="✅", custom_id=f"party:accept:{invite_id}"))
         self.invite_id = invite_id
-        self.target_id = target_id
-        self.add_item(self._make_accept_button())
-
-    def _make_accept_button(self) -> discord.ui.Button:
-        btn = discord.ui.Button(label="✅ Accept Invite", style=discord.ButtonStyle.success, emoji="✅")
-        async def on_click(interaction: discord.Interaction):
-            if interaction.user.id != self.target_id:
-                await interaction.response.send_message("This invite is not for you!", ephemeral=True)
-                return
-            res = await self.bot.party_system.accept_invite(self.target_id, self.invite_id)
-            if res["success"]:
-                await interaction.response.edit_message(content="🎉 Joined the party!", view=None)
-            else:
-                await interaction.response.send_message(f"❌ {res['message']}", ephemeral=True)
-        btn.callback = on_click
-        return btn
+
+    @classmethod
+    async def from_custom_id(cls, interaction: discord.Interaction, item: discord.ui.Button, match):
+        return cls(match["invite_id"])
+
+    async def callback(self, interaction: discord.Interaction):
+        party_system = interaction.client.party_system
+        invite = party_system.party_invites.get(self.invite_id)
+        if invite is None:
+            await interaction.response.send_message("❌ Invite not found", ephemeral=True)
+            return
+        if interaction.user.id != invite["target_id"]:
+            await interaction.response.send_message("This invite is not for you!", ephemeral=True)
+            return
+        res = await party_system.accept_invite(interaction.user.id, self.invite_id)
+        if res["success"]:
+            await interaction.response.edit_message(content="🎉 Joined the party!", view=None)
+        else:
+            await interaction.response.send_message(f"❌ {res['message']}", ephemeral=True)
+
+class PartyInviteAcceptView(discord.ui.View):
+    __slots__ = ()
+
+    def __init__(self, invite_id: str):
+        super().__init__(timeout=None)
+        self.add_item(PartyInviteAcceptButton(invite_id))
 
 async def setup(bot):
-    await bot.add_cog(PartyCog(bot))
+    cog = PartyCog(bot)
+    await bot.add_cog(cog)
+    # Register the shared view and invite buttons so they keep working across restarts
+    bot.add_view(cog.already_in_view)
+    bot.add_dynamic_items(PartyInviteAcceptButton)
@@ -1,35 +1,149 @@
+import asyncio
 import discord
 from discord.ext import commands
 from discord import app_commands
+import functools
 import logging
+from datetime import datetime
+from itertools import islice
+from types import MappingProxyType
 from typing import Optional
 import random
 
+from utils.cache import PlayerCache, TTLCache
 from utils.helpers import create_embed, format_number
 
 logger = logging.getLogger(__name__)
 
+# user_id -> (character, pets, active pet)
+PET_CACHE_SIZE = 256
+_pet_snapshots = PlayerCache(PET_CACHE_SIZE)
+
+# Seconds the adoption catalog is reused before asking the pet system again
+PET_CATALOG_TTL = 60.0
+_pet_catalog = TTLCache(PET_CATALOG_TTL)
+
+# Inactive pets listed by name in the /pets embed
+INACTIVE_PREVIEW = 5
+
+RARITY_EMOJI = MappingProxyType({
+    "Common": "⚪", "Uncommon": "🟢", "Rare": "🔵",
+    "Epic": "🟣", "Legendary": "🟡"
+})
+
+async def _fetch_pets(bot, user_id: int) -> tuple:
+    character, pets = await asyncio.gather(
+        bot.character_system.get_character(user_id),
+        bot.pet_system.get_pets(user_id),
+    )
+    active_pet = next((p for p in pets if p.get("active", False)), None)
+    return character, pets, active_pet
+
+async def _load_pets(bot, user_id: int):
+    """Fetch a user's character and pets, reusing the last result until their player data is saved again"""
+    return await _pet_snapshots.get(bot.db, user_id, lambda: _fetch_pets(bot, user_id))
+
+def _pet_display(pet: dict) -> tuple:
+    """(name, level, exp, exp_needed, exp_percent, bonus, type) for rendering a pet"""
+    get = pet.get
+    exp = get("exp", 0)
+    exp_needed = get("exp_needed", 100)
+    exp_percent = (exp / exp_needed * 100) if exp_needed > 0 else 0
+    return (pet["name"], get("level", 1), exp, exp_needed, exp_percent, get("bonus", 0), get("type", "Unknown"))
+
+async def _get_catalog(bot) -> list:
+    """Pets available for adoption, reloaded at most once per PET_CATALOG_TTL"""
+    return await _pet_catalog.get("available", bot.pet_system.get_available_pets)
+
+_NO_CHAR_EMBED = create_embed(
+    title="❌ No Character Found",
+    description="You need to create a character first! Use `/character`",
+    color=discord.Color.red()
+)
+# Built once at import, so a timestamp would be stale
+_NO_CHAR_EMBED.timestamp = None
+
+# Colours of the set-active / training / adoption result embeds
+_SUCCESS_COLOR = discord.Color.green()
+_FAIL_COLOR = discord.Color.red()
+
+# catalog key -> (adoption embed template, adoption select options)
+_adoption_renders: dict = {}
+
+def _catalog_key(available_pets: list) -> tuple:
+    """The parts of the adoption catalog that end up in the embed or the select"""
+    return tuple(
+        (pet["id"], pet["name"], pet.get("rarity"), pet.get("cost"), pet.get("bonus"), pet.get("description"))
+        for pet in islice(available_pets, 25)
+    )
+
+def _adoption_render(available_pets: list) -> tuple:
+    """Adoption embed template and select options, built once per distinct catalog"""
+    key = _catalog_key(available_pets)
+    cached = _adoption_renders.get(key)
+    if cached is not None:
+        return cached
+    
+    # The description is per-user and patched onto a copy by the caller
+    embed = create_embed(
+        title=f"🏠 Pet Adoption Center",
+        color=discord.Color.blue()
+    )
+    
+    if not available_pets:
+        embed.add_field(name="🏠 No Pets Available", value="Check back later for new pets!", inline=False)
+    
+    fmt = format_number
+    SelectOption = discord.SelectOption
+    for pet in available_pets[:5]:  # Show first 5
+        cost = pet.get("cost", 0)
+        rarity = pet.get("rarity", "Common")
+        rarity_emoji = RARITY_EMOJI.get(rarity, "⚪")
+        
+        pet_text = (
+            f"{rarity_emoji} **{pet['name']}** ({rarity})\n"
+            f"📝 {pet.get('description', 'No description')}\n"
+            f"💰 Cost: {fmt(cost)} gold\n"
+            f"🎯 Bonus: +{pet.get('bonus', 0)}% to stats\n\n"
+        )
+        
+        embed.add_field(name=f"🏠 Available Pet", value=pet_text, inline=False)
+    
+    options = [
+        SelectOption(
+            label=f"{pet['name']} ({pet.get('rarity', 'Common')}) - {fmt(pet.get('cost', 0))} gold",
+            description=pet.get("description", "No description"),
+            value=pet["id"]
+        )
+        for pet in islice(available_pets, 25)  # Discord limit
+    ]
+    
+    _adoption_renders.clear()
+    cached = _adoption_renders[key] = (embed, options)
+    return cached
+
 class PetsCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
+        self._ps = bot.pet_system
+
+    async def _require_character(self, interaction: discord.Interaction) -> Optional[tuple]:
+        """Load the user's (character, pets, active pet), or tell them to create a character first"""
+        snapshot = await _load_pets(self.bot, interaction.user.id)
+        if not snapshot[0]:
+            await interaction.response.send_message(embed=_NO_CHAR_EMBED, ephemeral=True)
+            return None
+        return snapshot
 
     @app_commands.command(name="pets", description="Manage your pets and companions")
     async def pets(self, interaction: discord.Interaction):
         """Manage pets and companions"""
         user_id = interaction.user.id
         
-        character = await self.bot.character_system.get_character(user_id)
-        if not character:
-            embed = create_embed(
-                title="❌ No Character Found",
-                description="You need to create a character first! Use `/character`",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+        snapshot = await self._require_character(interaction)
+        if snapshot is None:
             return
-        
-        # Get pets
-        pets = await self.bot.pet_system.get_pets(user_id)
+        character, pets, _ = snapshot
         
         embed = self._create_pets_embed(character, pets)
         view = PetsView(self.bot, user_id)
@@ -40,21 +154,17 @@ class PetsCog(commands.Cog):
         """Adopt a new pet"""
         user_id = interaction.user.id
         
-        character = await self.bot.character_system.get_character(user_id)
-        if not character:
-            embed = create_embed(
-                title="❌ No Character Found",
-                description="You need to create a character first! Use `/character`",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+        # Get available pets for adoption alongside the character check
+        snapshot, available_pets = await asyncio.gather(
+            self._require_character(interaction),
+            _get_catalog(self.bot),
+        )
+        if snapshot is None:
             return
-        
-        # Get available pets for adoption
-        available_pets = await self.bot.pet_system.get_available_pets()
+        character = snapshot[0]
         
         embed = self._create_adoption_embed(character, available_pets)
-        view = AdoptionView(self.bot, user_id, available_pets)
+        view = PetActionView(self.bot, user_id, "adopt", list(_adoption_render(available_pets)[1]))
         await interaction.response.send_message(embed=embed, view=view)
 
     @app_commands.command(name="train", description="Train your active pet")
@@ -62,18 +172,11 @@ class PetsCog(commands.Cog):
         """Train your active pet"""
         user_id = interaction.user.id
         
-        character = await self.bot.character_system.get_character(user_id)
-        if not character:
-            embed = create_embed(
-                title="❌ No Character Found",
-                description="You need to create a character first! Use `/character`",
-                color=discord.Color.red()
-            )
-            await interaction.response.send_message(embed=embed, ephemeral=True)
+        snapshot = await self._require_character(interaction)
+        if snapshot is None:
             return
+        character, _, active_pet = snapshot
         
-        # Get active pet
-        active_pet = await self.bot.pet_system.get_active_pet(user_id)
         if not active_pet:
             embed = create_embed(
                 title="❌ No Active Pet",
@@ -84,10 +187,10 @@ class PetsCog(commands.Cog):
             return
         
         # Get training options
-        training_options = await self.bot.pet_system.get_training_options(active_pet)
+        training_options = await self._ps.get_training_options(active_pet)
         
         embed = self._create_training_embed(character, active_pet, training_options)
-        view = TrainingView(self.bot, user_id, active_pet, training_options)
+        view = PetActionView(self.bot, user_id, "train", _training_options(training_options))
         await interaction.response.send_message(embed=embed, view=view)
 
     def _create_pets_embed(self, character, pets):
@@ -102,47 +205,58 @@ class PetsCog(commands.Cog):
             embed.add_field(name="🐾 No Pets", value="Adopt a pet to get started!", inline=False)
             return embed
         
-        # Group pets by status
-        active_pets = [p for p in pets if p.get("active", False)]
-        inactive_pets = [p for p in pets if not p.get("active", False)]
+        # Group pets by status and total them up in the same pass
+        active_pets, inactive_pets = [], []
+        inactive_count = 0
+        total_levels = 0
+        total_bonus = 0
+        for p in pets:
+            pget = p.get
+            total_levels += pget("level", 1)
+            if pget("active", False):
+                active_pets.append(p)
+                total_bonus += pget("bonus", 0)
+            else:
+                # Only the first INACTIVE_PREVIEW are shown, the rest are just counted
+                inactive_count += 1
+                if inactive_count <= INACTIVE_PREVIEW:
+                    inactive_pets.append(p)
         
         # Active pets
         if active_pets:
-            active_text = ""
+            active_lines = []
             for pet in active_pets:
-                level = pet.get("level", 1)
-                exp = pet.get("exp", 0)
-                exp_needed = pet.get("exp_needed", 100)
-                exp_percent = (exp / exp_needed * 100) if exp_needed > 0 else 0
-                
-                active_text += f"🐾 **{pet['name']}** (Level {level})\n"
-                active_text += f"   Type: {pet.get('type', 'Unknown')}\n"
-                active_text += f"   EXP: {exp}/{exp_needed} ({exp_percent:.1f}%)\n"
-                active_text += f"   Bonus: +{pet.get('bonus', 0)}% to stats\n\n"
+                name, level, exp, exp_needed, exp_percent, bonus, pet_type = _pet_display(pet)
+                active_lines.append(
+                    f"🐾 **{name}** (Level {level})\n"
+                    f"   Type: {pet_type}\n"
+                    f"   EXP: {exp}/{exp_needed} ({exp_percent:.1f}%)\n"
+                    f"   Bonus: +{bonus}% to stats\n\n"
+                )
             
-            embed.add_field(name="🐾 Active Pets", value=active_text, inline=False)
+            embed.add_field(name="🐾 Active Pets", value="".join(active_lines), inline=False)
         
         # Inactive pets
         if inactive_pets:
-            inactive_text = ""
-            for pet in inactive_pets[:5]:  # Show first 5
-                level = pet.get("level", 1)
-                inactive_text += f"🐾 **{pet['name']}** (Level {level})\n"
-                inactive_text += f"   Type: {pet.get('type', 'Unknown')}\n\n"
+            inactive_lines = [
+                f"🐾 **{pet['name']}** (Level {pet.get('level', 1)})\n"
+                f"   Type: {pet.get('type', 'Unknown')}\n\n"
+                for pet in inactive_pets
+            ]
             
-            if len(inactive_pets) > 5:
-                inactive_text += f"... and {len(inactive_pets) - 5} more pets"
+            if inactive_count > INACTIVE_PREVIEW:
+                inactive_lines.append(f"... and {inactive_count - INACTIVE_PREVIEW} more pets")
             
-            embed.add_field(name="🐾 Inactive Pets", value=inactive_text, inline=False)
+            embed.add_field(name="🐾 Inactive Pets", value="".join(inactive_lines), inline=False)
         
         # Add stats
         total_pets = len(pets)
-        total_levels = sum(p.get("level", 1) for p in pets)
-        total_bonus = sum(p.get("bonus", 0) for p in active_pets)
         
-        stats_text = f"📊 **Total Pets:** {total_pets}\n"
-        stats_text += f"📈 **Total Levels:** {total_levels}\n"
-        stats_text += f"🎯 **Active Bonus:** +{total_bonus}% to stats"
+        stats_text = (
+            f"📊 **Total Pets:** {total_pets}\n"
+            f"📈 **Total Levels:** {total_levels}\n"
+            f"🎯 **Active Bonus:** +{total_bonus}% to stats"
+        )
         
         embed.add_field(name="📈 Stats", value=stats_text, inline=False)
         
@@ -150,34 +264,9 @@ class PetsCog(commands.Cog):
 
     def _create_adoption_embed(self, character, available_pets):
         """Create adoption embed"""
-        embed = create_embed(
-            title=f"🏠 Pet Adoption Center",
-            description=f"Welcome {character['username']}! Choose your new companion.",
-            color=discord.Color.blue()
-        )
-        
-        if not available_pets:
-            embed.add_field(name="🏠 No Pets Available", value="Check back later for new pets!", inline=False)
-            return embed
-        
-        for pet in available_pets[:5]:  # Show first 5
-            cost = pet.get("cost", 0)
-            rarity = pet.get("rarity", "Common")
-            rarity_emoji = {
-                "Common": "⚪",
-                "Uncommon": "🟢", 
-                "Rare": "🔵",
-                "Epic": "🟣",
-                "Legendary": "🟡"
-            }.get(rarity, "⚪")
-            
-            pet_text = f"{rarity_emoji} **{pet['name']}** ({rarity})\n"
-            pet_text += f"📝 {pet.get('description', 'No description')}\n"
-            pet_text += f"💰 Cost: {format_number(cost)} gold\n"
-            pet_text += f"🎯 Bonus: +{pet.get('bonus', 0)}% to stats\n\n"
-            
-            embed.add_field(name=f"🏠 Available Pet", value=pet_text, inline=False)
-        
+        embed = _adoption_render(available_pets)[0].copy()
+        embed.description = f"Welcome {character['username']}! Choose your new companion."
+        embed.timestamp = datetime.utcnow()
         return embed
 
     def _create_training_embed(self, character, active_pet, training_options):
@@ -189,340 +278,174 @@ class PetsCog(commands.Cog):
         )
         
         # Pet info
-        level = active_pet.get("level", 1)
-        exp = active_pet.get("exp", 0)
-        exp_needed = active_pet.get("exp_needed", 100)
-        exp_percent = (exp / exp_needed * 100) if exp_needed > 0 else 0
-        
-        pet_info = f"🐾 **{active_pet['name']}** (Level {level})\n"
-        pet_info += f"📊 EXP: {exp}/{exp_needed} ({exp_percent:.1f}%)\n"
-        pet_info += f"🎯 Current Bonus: +{active_pet.get('bonus', 0)}% to stats\n"
-        pet_info += f"💰 Training Cost: {format_number(active_pet.get('training_cost', 100))} gold"
+        name, level, exp, exp_needed, exp_percent, bonus, _ = _pet_display(active_pet)
+        pet_info = (
+            f"🐾 **{name}** (Level {level})\n"
+            f"📊 EXP: {exp}/{exp_needed} ({exp_percent:.1f}%)\n"
+            f"🎯 Current Bonus: +{bonus}% to stats\n"
+            f"💰 Training Cost: {format_number(active_pet.get('training_cost', 100))} gold"
+        )
         
         embed.add_field(name="🐾 Pet Info", value=pet_info, inline=False)
         
         # Training options
         if training_options:
-            training_text = ""
+            training_lines = []
+            fmt = format_number
             for option in training_options:
                 cost = option.get("cost", 0)
                 exp_gain = option.get("exp_gain", 0)
                 success_rate = option.get("success_rate", 100)
                 
-                training_text += f"🎓 **{option['name']}**\n"
-                training_text += f"   📝 {option.get('description', 'No description')}\n"
-                training_text += f"   💰 Cost: {format_number(cost)} gold\n"
-                training_text += f"   ⭐ EXP Gain: {exp_gain}\n"
-                training_text += f"   🎯 Success Rate: {success_rate}%\n\n"
+                training_lines.append(
+                    f"🎓 **{option['name']}**\n"
+                    f"   📝 {option.get('description', 'No description')}\n"
+                    f"   💰 Cost: {fmt(cost)} gold\n"
+                    f"   ⭐ EXP Gain: {exp_gain}\n"
+                    f"   🎯 Success Rate: {success_rate}%\n\n"
+                )
             
-            embed.add_field(name="🎓 Training Options", value=training_text, inline=False)
+            embed.add_field(name="🎓 Training Options", value="".join(training_lines), inline=False)
         else:
             embed.add_field(name="🎓 No Training Available", value="Your pet is at max level!", inline=False)
         
         return embed
 
-class PetsView(discord.ui.View):
-    def __init__(self, bot, user_id: int):
+def _pet_options(pets: list) -> list:
+    SelectOption = discord.SelectOption
+    return [
+        SelectOption(
+            label=f"{pet['name']} (Level {pet.get('level', 1)})",
+            description=f"Type: {pet.get('type', 'Unknown')}",
+            value=pet["id"]
+        )
+        for pet in islice(pets, 25)  # Discord limit
+    ]
+
+def _training_options(training_options: list) -> list:
+    SelectOption = discord.SelectOption
+    fmt = format_number
+    return [
+        SelectOption(
+            label=f"{option['name']} - {fmt(option.get('cost', 0))} gold",
+            description=f"EXP Gain: {option.get('exp_gain', 0)}",
+            value=option["id"]
+        )
+        for option in islice(training_options, 25)  # Discord limit
+    ]
+
+def _set_active_result(result: dict) -> discord.Embed:
+    if result["success"]:
+        return create_embed(
+            title="✅ Pet Set Active!",
+            description=f"**{result['pet_name']}** is now your active companion!",
+            color=_SUCCESS_COLOR
+        )
+    return create_embed(title="❌ Failed to Set Active", description=result["message"], color=_FAIL_COLOR)
+
+def _training_result(result: dict) -> discord.Embed:
+    if not result["success"]:
+        return create_embed(title="❌ Training Failed", description=result["message"], color=_FAIL_COLOR)
+    embed = create_embed(
+        title="🎓 Training Successful!",
+        description=f"**{result['pet_name']}** gained {result['exp_gained']} EXP!",
+        color=_SUCCESS_COLOR
+    )
+    if result.get("leveled_up"):
+        embed.add_field(name="🎉 Level Up!", value=f"**{result['pet_name']}** reached level {result['new_level']}!", inline=False)
+    return embed
+
+def _adoption_result(result: dict) -> discord.Embed:
+    if result["success"]:
+        return create_embed(
+            title="🏠 Adoption Successful!",
+            description=f"Welcome **{result['pet_name']}** to your family!",
+            color=_SUCCESS_COLOR
+        )
+    return create_embed(title="❌ Adoption Failed", description=result["message"], color=_FAIL_COLOR)
+
+# action -> (select placeholder, select custom_id, PetSystem method, result embed builder)
+PET_ACTIONS = MappingProxyType({
+    "set_active": ("🐾 Select pet to set active", "pet_select", "set_active_pet", _set_active_result),
+    "train": ("🎓 Select training option", "training_select", "train_pet", _training_result),
+    "adopt": ("🏠 Select pet to adopt", "adoption_select", "adopt_pet", _adoption_result),
+})
+
+class PetActionView(discord.ui.View):
+    """Select menus that run a PET_ACTIONS entry on the picked value and report the result"""
+    __slots__ = ("bot", "_ps", "user_id")
+
+    def __init__(self, bot, user_id: int, action: Optional[str] = None, options: Optional[list] = None):
         super().__init__(timeout=60.0)
         self.bot = bot
+        self._ps = bot.pet_system
         self.user_id = user_id
+        if action and options:
+            self._add_action_select(action, options)
 
-    @discord.ui.button(label="🐾 Set Active", style=discord.ButtonStyle.primary, emoji="🐾")
-    async def set_active(self, interaction: discord.Interaction, button: discord.ui.Button):
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
         if interaction.user.id != self.user_id:
             await interaction.response.send_message("This is not for you!", ephemeral=True)
-            return
-        
+            return False
+        return True
+
+    def _add_action_select(self, action: str, options: list):
+        placeholder, custom_id, _, _ = PET_ACTIONS[action]
+        select = discord.ui.Select(placeholder=placeholder, options=options, custom_id=custom_id)
+        select.callback = functools.partial(self._action_callback, action)
+        self.add_item(select)
+
+    async def _action_callback(self, action: str, interaction: discord.Interaction):
+        """Handle a selection for any pet action"""
+        _, _, method, render = PET_ACTIONS[action]
+        result = await getattr(self._ps, method)(self.user_id, interaction.data["values"][0])
+        await interaction.response.send_message(embed=render(result), ephemeral=True)
+
+class PetsView(PetActionView):
+    """Pet menu buttons; each one replies with its own single-select PetActionView"""
+    __slots__ = ()
+
+    @discord.ui.button(label="🐾 Set Active", style=discord.ButtonStyle.primary, emoji="🐾")
+    async def set_active(self, interaction: discord.Interaction, button: discord.ui.Button):
         # Get user's pets
-        pets = await self.bot.pet_system.get_pets(self.user_id)
+        _, pets, _ = await _load_pets(self.bot, self.user_id)
         if not pets:
             await interaction.response.send_message("❌ You don't have any pets!", ephemeral=True)
             return
         
         # Create pet selection dropdown
-        options = []
-        for pet in pets[:25]:  # Discord limit
-            options.append(discord.SelectOption(
-                label=f"{pet['name']} (Level {pet.get('level', 1)})",
-                description=f"Type: {pet.get('type', 'Unknown')}",
-                value=pet["id"]
-            ))
-        
-        if options:
-            select = discord.ui.Select(
-                placeholder="🐾 Select pet to set active",
-                options=options,
-                custom_id="pet_select"
-            )
-            select.callback = self._pet_callback
-            self.add_item(select)
-            
-            await interaction.response.send_message("🐾 Select a pet to set as active:", ephemeral=True)
-        else:
-            await interaction.response.send_message("❌ No pets available!", ephemeral=True)
+        view = PetActionView(self.bot, self.user_id, "set_active", _pet_options(pets))
+        await interaction.response.send_message("🐾 Select a pet to set as active:", view=view, ephemeral=True)
 
     @discord.ui.button(label="🎓 Train", style=discord.ButtonStyle.success, emoji="🎓")
     async def train_pet(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This is not for you!", ephemeral=True)
-            return
-        
         # Get active pet
-        active_pet = await self.bot.pet_system.get_active_pet(self.user_id)
+        _, _, active_pet = await _load_pets(self.bot, self.user_id)
         if not active_pet:
             await interaction.response.send_message("❌ You don't have an active pet!", ephemeral=True)
             return
         
         # Get training options
-        training_options = await self.bot.pet_system.get_training_options(active_pet)
+        training_options = await self._ps.get_training_options(active_pet)
         if not training_options:
             await interaction.response.send_message("❌ Your pet is at max level!", ephemeral=True)
             return
         
         # Create training selection dropdown
-        options = []
-        for option in training_options[:25]:  # Discord limit
-            cost = option.get("cost", 0)
-            exp_gain = option.get("exp_gain", 0)
-            options.append(discord.SelectOption(
-                label=f"{option['name']} - {format_number(cost)} gold",
-                description=f"EXP Gain: {exp_gain}",
-                value=option["id"]
-            ))
-        
-        if options:
-            select = discord.ui.Select(
-                placeholder="🎓 Select training option",
-                options=options,
-                custom_id="training_select"
-            )
-            select.callback = self._training_callback
-            self.add_item(select)
-            
-            await interaction.response.send_message("🎓 Select a training option:", ephemeral=True)
-        else:
-            await interaction.response.send_message("❌ No training options available!", ephemeral=True)
+        view = PetActionView(self.bot, self.user_id, "train", _training_options(training_options))
+        await interaction.response.send_message("🎓 Select a training option:", view=view, ephemeral=True)
 
     @discord.ui.button(label="🏠 Adopt", style=discord.ButtonStyle.secondary, emoji="🏠")
     async def adopt_pet(self, interaction: discord.Interaction, button: discord.ui.Button):
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This is not for you!", ephemeral=True)
-            return
-        
         # Get available pets
-        available_pets = await self.bot.pet_system.get_available_pets()
+        available_pets = await _get_catalog(self.bot)
         if not available_pets:
             await interaction.response.send_message("❌ No pets available for adoption!", ephemeral=True)
             return
         
         # Create adoption selection dropdown
-        options = []
-        for pet in available_pets[:25]:  # Discord limit
-            cost = pet.get("cost", 0)
-            rarity = pet.get("rarity", "Common")
-            options.append(discord.SelectOption(
-                label=f"{pet['name']} ({rarity}) - {format_number(cost)} gold",
-                description=pet.get("description", "No description"),
-                value=pet["id"]
-            ))
-        
-        if options:
-            select = discord.ui.Select(
-                placeholder="🏠 Select pet to adopt",
-                options=options,
-                custom_id="adoption_select"
-            )
-            select.callback = self._adoption_callback
-            self.add_item(select)
-            
-            await interaction.response.send_message("🏠 Select a pet to adopt:", ephemeral=True)
-        else:
-            await interaction.response.send_message("❌ No pets available for adoption!", ephemeral=True)
-
-    async def _pet_callback(self, interaction: discord.Interaction):
-        """Handle pet selection"""
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This is not for you!", ephemeral=True)
-            return
-        
-        pet_id = interaction.data["values"][0]
-        result = await self.bot.pet_system.set_active_pet(self.user_id, pet_id)
-        
-        if result["success"]:
-            embed = create_embed(
-                title="✅ Pet Set Active!",
-                description=f"**{result['pet_name']}** is now your active companion!",
-                color=discord.Color.green()
-            )
-        else:
-            embed = create_embed(
-                title="❌ Failed to Set Active",
-                description=result["message"],
-                color=discord.Color.red()
-            )
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-
-    async def _training_callback(self, interaction: discord.Interaction):
-        """Handle training selection"""
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This is not for you!", ephemeral=True)
-            return
-        
-        training_id = interaction.data["values"][0]
-        result = await self.bot.pet_system.train_pet(self.user_id, training_id)
-        
-        if result["success"]:
-            embed = create_embed(
-                title="🎓 Training Successful!",
-                description=f"**{result['pet_name']}** gained {result['exp_gained']} EXP!",
-                color=discord.Color.green()
-            )
-            
-            if result.get("leveled_up"):
-                embed.add_field(name="🎉 Level Up!", value=f"**{result['pet_name']}** reached level {result['new_level']}!", inline=False)
-        else:
-            embed = create_embed(
-                title="❌ Training Failed",
-                description=result["message"],
-                color=discord.Color.red()
-            )
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-
-    async def _adoption_callback(self, interaction: discord.Interaction):
-        """Handle adoption selection"""
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This is not for you!", ephemeral=True)
-            return
-        
-        pet_id = interaction.data["values"][0]
-        result = await self.bot.pet_system.adopt_pet(self.user_id, pet_id)
-        
-        if result["success"]:
-            embed = create_embed(
-                title="🏠 Adoption Successful!",
-                description=f"Welcome **{result['pet_name']}** to your family!",
-                color=discord.Color.green()
-            )
-        else:
-            embed = create_embed(
-                title="❌ Adoption Failed",
-                description=result["message"],
-                color=discord.Color.red()
-            )
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-
-class AdoptionView(discord.ui.View):
-    def __init__(self, bot, user_id: int, available_pets: list):
-        super().__init__(timeout=60.0)
-        self.bot = bot
-        self.user_id = user_id
-        self.available_pets = available_pets
-        self._add_pet_select()
-
-    def _add_pet_select(self):
-        """Add pet selection dropdown"""
-        options = []
-        for pet in self.available_pets[:25]:  # Discord limit
-            cost = pet.get("cost", 0)
-            rarity = pet.get("rarity", "Common")
-            options.append(discord.SelectOption(
-                label=f"{pet['name']} ({rarity}) - {format_number(cost)} gold",
-                description=pet.get("description", "No description"),
-                value=pet["id"]
-            ))
-        
-        if options:
-            select = discord.ui.Select(
-                placeholder="🏠 Select pet to adopt",
-                options=options,
-                custom_id="adoption_select"
-            )
-            select.callback = self._adoption_callback
-            self.add_item(select)
-
-    async def _adoption_callback(self, interaction: discord.Interaction):
-        """Handle adoption selection"""
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This is not for you!", ephemeral=True)
-            return
-        
-        pet_id = interaction.data["values"][0]
-        result = await self.bot.pet_system.adopt_pet(self.user_id, pet_id)
-        
-        if result["success"]:
-            embed = create_embed(
-                title="🏠 Adoption Successful!",
-                description=f"Welcome **{result['pet_name']}** to your family!",
-                color=discord.Color.green()
-            )
-        else:
-            embed = create_embed(
-                title="❌ Adoption Failed",
-                description=result["message"],
-                color=discord.Color.red()
-            )
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
-
-class TrainingView(discord.ui.View):
-    def __init__(self, bot, user_id: int, active_pet: dict, training_options: list):
-        super().__init__(timeout=60.0)
-        self.bot = bot
-        self.user_id = user_id
-        self.active_pet = active_pet
-        self.training_options = training_options
-        self._add_training_select()
-
-    def _add_training_select(self):
-        """Add training selection dropdown"""
-        options = []
-        for option in self.training_options[:25]:  # Discord limit
-            cost = option.get("cost", 0)
-            exp_gain = option.get("exp_gain", 0)
-            options.append(discord.SelectOption(
-                label=f"{option['name']} - {format_number(cost)} gold",
-                description=f"EXP Gain: {exp_gain}",
-                value=option["id"]
-            ))
-        
-        if options:
-            select = discord.ui.Select(
-                placeholder="🎓 Select training option",
-                options=options,
-                custom_id="training_select"
-            )
-            select.callback = self._training_callback
-            self.add_item(select)
-
-    async def _training_callback(self, interaction: discord.Interaction):
-        """Handle training selection"""
-        if interaction.user.id != self.user_id:
-            await interaction.response.send_message("This is not for you!", ephemeral=True)
-            return
-        
-        training_id = interaction.data["values"][0]
-        result = await self.bot.pet_system.train_pet(self.user_id, training_id)
-        
-        if result["success"]:
-            embed = create_embed(
-                title="🎓 Training Successful!",
-                description=f"**{result['pet_name']}** gained {result['exp_gained']} EXP!",
-                color=discord.Color.green()
-            )
-            
-            if result.get("leveled_up"):
-                embed.add_field(name="🎉 Level Up!", value=f"**{result['pet_name']}** reached level {result['new_level']}!", inline=False)
-        else:
-            embed = create_embed(
-                title="❌ Training Failed",
-                description=result["message"],
-                color=discord.Color.red()
-            )
-        
-        await interaction.response.send_message(embed=embed, ephemeral=True)
+        view = PetActionView(self.bot, self.user_id, "adopt", list(_adoption_render(available_pets)[1]))
+        await interaction.response.send_message("🏠 Select a pet to adopt:", view=view, ephemeral=True)
 
 async def setup(bot):
     await bot.add_cog(PetsCog(bot))
@@ -1,7 +1,12 @@
+import asyncio
+import logging
+import random
+from itertools import islice
 import discord
 from discord.ext import commands
 from discord import app_commands
 
+from utils.cache import TTLCache
 from utils.helpers import create_embed, format_number
 
 # Import interactive sub-views from other cogs
@@ -9,11 +14,29 @@ from cogs.dungeon import DungeonView
 from cogs.quests import DailyQuestsView as DailyView
 from cogs.guild_interactive import GuildInteractiveView
 
+logger = logging.getLogger(__name__)
+
+# Seconds the monster, dungeon and shop tables are reused before reloading
+CATALOG_CACHE_TTL = 60.0
+
+_catalog_cache = TTLCache(CATALOG_CACHE_TTL)
+
+# _BARS[n] is a 10-cell bar with n cells filled
+_BARS = tuple("█" * i + "░" * (10 - i) for i in range(11))
+
+async def _load_monster_table(bot) -> tuple:
+    """Monster definitions plus a tuple of their ids, so picking one needs no key copy"""
+    monsters_data = await bot.db.load_monsters()
+    return monsters_data, tuple(monsters_data or ())
+
 class PlayView(discord.ui.View):
     def __init__(self, bot, user_id: int, timeout: float = 600.0):
         super().__init__(timeout=timeout)
         self.bot = bot
         self.user_id = user_id
+        self._guild_cog = bot.get_cog("GuildInteractiveCog")
+        # Strong references to running background work, so it is not collected mid-flight
+        self._bg_tasks = set()
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         if interaction.user.id != self.user_id:
@@ -23,10 +46,11 @@ class PlayView(discord.ui.View):
 
     @discord.ui.button(label="Profile", style=discord.ButtonStyle.primary, emoji="👤")
     async def profile_btn(self, interaction: discord.Interaction, _: discord.ui.Button):
-        char = await self.bot.character_system.get_character(self.user_id)
+        await interaction.response.defer()
+        char = await self.bot.character_system.get_character_cached(self.user_id)
         if not char:
             embed = create_embed(title="👤 Profile", description="No character found. Use the Create button below.", color=discord.Color.red())
-            await interaction.response.edit_message(embed=embed, view=self)
+            await interaction.edit_original_response(embed=embed, view=self)
             return
         stats = self.bot.character_system.format_character_display(char)
         hp_bar = self._bar(stats["stats"].get("hp", 0), stats["stats"].get("max_hp", 1))
@@ -41,41 +65,46 @@ class PlayView(discord.ui.View):
                 {"name": "Combat", "value": f"W/L: {char.get('battles_won',0)}/{char.get('battles_lost',0)} | Dungeons: {char.get('dungeons_completed',0)}", "inline": True},
             ],
         )
-        await interaction.response.edit_message(embed=embed, view=self)
+        await interaction.edit_original_response(embed=embed, view=self)
 
     @discord.ui.button(label="Hunt", style=discord.ButtonStyle.danger, emoji="⚔️")
     async def hunt_btn(self, interaction: discord.Interaction, _: discord.ui.Button):
+        await interaction.response.defer()
         user_id = self.user_id
-        character = await self.bot.character_system.get_character(user_id)
+        character, (monsters_data, monster_ids) = await asyncio.gather(
+            self.bot.character_system.get_character_cached(user_id),
+            _catalog_cache.get("monsters", lambda: _load_monster_table(self.bot)),
+        )
         if not character:
-            await interaction.response.send_message("Create a character first.", ephemeral=True)
+            await interaction.followup.send("Create a character first.", ephemeral=True)
             return
-        monsters_data = await self.bot.db.load_monsters()
         if not monsters_data:
-            await interaction.response.send_message("No monsters available.", ephemeral=True)
+            await interaction.followup.send("No monsters available.", ephemeral=True)
             return
-        import random
-        monster = monsters_data[random.choice(list(monsters_data.keys()))]
+        monster = monsters_data[random.choice(monster_ids)]
         result = await self.bot.combat_system.start_battle(user_id, monster)
         if not result["success"]:
-            await interaction.response.send_message(result.get("message", "Cannot start battle."), ephemeral=True)
+            await interaction.followup.send(result.get("message", "Cannot start battle."), ephemeral=True)
             return
         battle = result["battle"]
         embed_data = self.bot.combat_system.get_battle_embed(battle)
         embed = create_embed(**embed_data)
-        await interaction.response.edit_message(embed=embed, view=None)
+        await interaction.edit_original_response(embed=embed, view=None)
 
     @discord.ui.button(label="Dungeon", style=discord.ButtonStyle.success, emoji="🏰")
     async def dungeon_btn(self, interaction: discord.Interaction, _: discord.ui.Button):
+        await interaction.response.defer()
         user_id = self.user_id
-        char = await self.bot.character_system.get_character(user_id)
+        dungeon_id = "forest"
+        char, dungeon = await asyncio.gather(
+            self.bot.character_system.get_character_cached(user_id),
+            _catalog_cache.get(("dungeon", dungeon_id), lambda: self.bot.db.get_dungeon(dungeon_id)),
+        )
         if not char:
-            await interaction.response.send_message("Create a character first.", ephemeral=True)
+            await interaction.followup.send("Create a character first.", ephemeral=True)
             return
-        dungeon_id = "forest"
-        dungeon = await self.bot.db.get_dungeon(dungeon_id)
         if not dungeon:
-            await interaction.response.send_message("Dungeon not found.", ephemeral=True)
+            await interaction.followup.send("Dungeon not found.", ephemeral=True)
             return
         session = await self.bot.dungeon_system.start_dungeon(user_id, dungeon_id)
         floors_obj = dungeon.get("floors")
@@ -87,30 +116,51 @@ class PlayView(discord.ui.View):
             color=discord.Color.purple(),
             fields=[{"name": "Floors", "value": str(floor_count), "inline": True}],
         )
-        await interaction.response.edit_message(embed=embed, view=DungeonView(self.bot, user_id))
+        await interaction.edit_original_response(embed=embed, view=DungeonView(self.bot, user_id))
 
     @discord.ui.button(label="Quests", style=discord.ButtonStyle.secondary, emoji="🧭")
     async def quests_btn(self, interaction: discord.Interaction, _: discord.ui.Button):
-        user_id = self.user_id
-        await self.bot.daily_quest_system.get_daily(user_id)
-        dv = DailyView(self.bot, user_id)
-        await interaction.response.edit_message(embed=create_embed(title="🧭 Daily Quests", description="Loading...", color=discord.Color.blurple()), view=dv)
-        await dv._refresh(interaction)
+        await interaction.response.defer()
+        dv = DailyView(self.bot, self.user_id)
+        await interaction.edit_original_response(embed=create_embed(title="🧭 Daily Quests", description="Loading...", color=discord.Color.blurple()), view=dv)
+        task = asyncio.create_task(self._finish_quests(interaction, dv))
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+
+    async def _finish_quests(self, interaction: discord.Interaction, dv: discord.ui.View):
+        """Load the daily quests and fill in the placeholder panel"""
+        try:
+            character, daily_quests = await asyncio.gather(
+                self.bot.character_system.get_character_cached(self.user_id),
+                self.bot.quest_system.get_daily_quests(self.user_id),
+            )
+            embed = self.bot.get_cog("QuestsCog")._create_daily_quests_embed(character, daily_quests)
+            await interaction.edit_original_response(embed=embed, view=dv)
+        except Exception as e:
+            logger.error(f"Error loading daily quests: {e}")
+            await interaction.edit_original_response(
+                embed=create_embed(title="❌ Error", description="Could not load your daily quests.", color=discord.Color.red()),
+                view=None,
+            )
 
     @discord.ui.button(label="Shop", style=discord.ButtonStyle.secondary, emoji="🏪")
     async def shop_btn(self, interaction: discord.Interaction, _: discord.ui.Button):
+        await interaction.response.defer()
         user_id = self.user_id
-        character = await self.bot.character_system.get_character(user_id)
-        shop_items = await self.bot.economy_system.get_shop_items()
+        character, shop_items = await asyncio.gather(
+            self.bot.character_system.get_character_cached(user_id),
+            _catalog_cache.get("shop_items", self.bot.economy_system.get_shop_items),
+        )
         if not shop_items:
-            await interaction.response.send_message("Shop is empty.", ephemeral=True)
+            await interaction.followup.send("Shop is empty.", ephemeral=True)
             return
-        desc = "\n".join([f"• {it['name']} — {it.get('price', it.get('value', 0))}g" for it in shop_items[:10]])
+        desc = "\n".join([f"• {it['name']} — {it.get('price', it.get('value', 0))}g" for it in islice(shop_items, 10)])
         embed = create_embed(title="🏪 Shop", description=desc, color=discord.Color.gold(), footer=f"Your Gold: {character.get('gold',0)}")
-        await interaction.response.edit_message(embed=embed, view=None) # Removed ShopView(self.bot, user_id, shop_items)
+        await interaction.edit_original_response(embed=embed, view=None) # Removed ShopView(self.bot, user_id, shop_items)
 
     @discord.ui.button(label="Faction", style=discord.ButtonStyle.secondary, emoji="🏳️")
     async def faction_btn(self, interaction: discord.Interaction, _: discord.ui.Button):
+        await interaction.response.defer()
         user_id = self.user_id
         embed = create_embed(title="🏳️ Factions", description="Use /guild to open the interactive faction panel.", color=discord.Color.blue())
         # Provide a small inline view with a button to trigger /guild
@@ -119,26 +169,23 @@ class PlayView(discord.ui.View):
         async def open_cb(i: discord.Interaction):
             if i.user.id != self.user_id:
                 return await i.response.send_message("Not for you", ephemeral=True)
-            try:
-                await i.response.defer()
-            except Exception:
-                pass
+            await i.response.defer()
             # Build guild embed directly
-            character = await self.bot.character_system.get_character(self.user_id)
-            cog = self.bot.get_cog("GuildInteractiveCog")
+            character = await self.bot.character_system.get_character_cached(self.user_id)
+            # The guild cog may have loaded after this panel was opened
+            cog = self._guild_cog or self.bot.get_cog("GuildInteractiveCog")
+            self._guild_cog = cog
             embed = cog._create_guild_embed(character) if cog else create_embed(title="Guild", description="Unavailable", color=discord.Color.red())
             v2 = GuildInteractiveView(self.bot, self.user_id, in_faction=bool(character.get("faction"))) if cog else None
             await i.followup.send(embed=embed, view=v2, ephemeral=False)
         open_btn.callback = open_cb
         v.add_item(open_btn)
-        await interaction.response.edit_message(embed=embed, view=v)
+        await interaction.edit_original_response(embed=embed, view=v)
 
     def _bar(self, current: int, maximum: int) -> str:
         if maximum <= 0:
-            return "██████████"
-        filled = int((current / maximum) * 10)
-        empty = 10 - filled
-        return "█" * filled + "░" * empty
+            return _BARS[10]
+        return _BARS[max(0, min(10, int(current * 10 // maximum)))]
 
 class PlayCog(commands.Cog):
     def __init__(self, bot):
@@ -181,7 +228,7 @@ class PlayCog(commands.Cog):
 
         embed.set_footer(text="Select a category below to access features!")
 
-        view = PlayMainView(self.bot, user_id)
+        view = PlayMainView(self.bot, user_id, character)
         await interaction.response.send_message(embed=embed, view=view)
 
 class NewPlayerView(discord.ui.View):
@@ -244,6 +291,113 @@ class NewPlayerView(discord.ui.View):
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
 
+# The category menus are the same for everyone, so they are built once at import
+# (without a timestamp, which would only ever show the load time)
+def _combat_menu_embed() -> discord.Embed:
+    embed = create_embed(
+        title="⚔️ Combat & Adventure",
+        description="Choose your adventure type:",
+        color=discord.Color.red()
+    )
+
+    embed.add_field(
+        name="🎯 Hunt Monsters",
+        value="`/hunt` - Fight wild monsters for XP and loot",
+        inline=False
+    )
+
+    embed.add_field(
+        name="�� Explore Dungeons",
+        value="`/dungeon` - Venture into dangerous dungeons",
+        inline=False
+    )
+
+    embed.add_field(
+        name="⚔️ Arena",
+        value="`/pvp @user` - Challenge other players\n`/arena` - Enter ranked battles",
+        inline=False
+    )
+
+    embed.add_field(
+        name="📜 Quests",
+        value="`/quests` - Take on epic adventures",
+        inline=False
+    )
+
+    # Direct command suggestions instead of broken view
+    embed.add_field(
+        name="🎮 Quick Actions",
+        value="`/hunt` - Start hunting\n`/dungeon` - Enter dungeon\n`/arena` - PvP battles",
+        inline=False
+    )
+    embed.timestamp = None
+    return embed
+
+def _economy_menu_embed() -> discord.Embed:
+    embed = create_embed(
+        title="💰 Economy & Trading",
+        description="Manage your wealth and items:",
+        color=discord.Color.gold()
+    )
+
+    embed.add_field(
+        name="🛒 Shopping",
+        value="`/shop` - Browse and buy items\n`/daily` - Claim daily rewards",
+        inline=False
+    )
+
+    embed.add_field(
+        name="📦 Inventory",
+        value="`/inventory` - Manage your items\n`/equipment` - View equipped gear",
+        inline=False
+    )
+
+    embed.add_field(
+        name="🔨 Crafting",
+        value="`/craft` - Create powerful items",
+        inline=False
+    )
+
+    # Direct command suggestions instead of broken view
+    embed.add_field(
+        name="🎮 Quick Actions", 
+        value="`/shop` - Browse shop\n`/inventory` - View items\n`/craft` - Start crafting",
+        inline=False
+    )
+    embed.timestamp = None
+    return embed
+
+def _social_menu_embed() -> discord.Embed:
+    embed = create_embed(
+        title="🏰 Social & Guilds",
+        description="Connect with other players:",
+        color=discord.Color.purple()
+    )
+
+    embed.add_field(
+        name="🏰 Guild System",
+        value="`/guild` - Join or manage your guild",
+        inline=False
+    )
+
+    embed.add_field(
+        name="👥 Party System",
+        value="`/party` - Form temporary groups",
+        inline=False
+    )
+
+    embed.add_field(
+        name="📊 Leaderboards",
+        value="`/leaderboard` - See top players\n`/profile @user` - View player profiles",
+        inline=False
+    )
+    embed.timestamp = None
+    return embed
+
+_COMBAT_EMBED = _combat_menu_embed()
+_ECONOMY_EMBED = _economy_menu_embed()
+_SOCIAL_EMBED = _social_menu_embed()
+
 class PlayMainView(discord.ui.View):
     def __init__(self, bot, user_id: int, character: dict):
         super().__init__(timeout=300.0)
@@ -257,44 +411,7 @@ class PlayMainView(discord.ui.View):
             await interaction.response.send_message("This is not for you!", ephemeral=True)
             return
         
-        embed = create_embed(
-            title="⚔️ Combat & Adventure",
-            description="Choose your adventure type:",
-            color=discord.Color.red()
-        )
-        
-        embed.add_field(
-            name="🎯 Hunt Monsters",
-            value="`/hunt` - Fight wild monsters for XP and loot",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="�� Explore Dungeons",
-            value="`/dungeon` - Venture into dangerous dungeons",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="⚔️ Arena",
-            value="`/pvp @user` - Challenge other players\n`/arena` - Enter ranked battles",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📜 Quests",
-            value="`/quests` - Take on epic adventures",
-            inline=False
-        )
-        
-        # Direct command suggestions instead of broken view
-        embed.add_field(
-            name="🎮 Quick Actions",
-            value="`/hunt` - Start hunting\n`/dungeon` - Enter dungeon\n`/arena` - PvP battles",
-            inline=False
-        )
-        
-        await interaction.response.edit_message(embed=embed, view=None)
+        await interaction.response.edit_message(embed=_COMBAT_EMBED, view=None)
 
     @discord.ui.button(label="💰 Economy", style=discord.ButtonStyle.success, emoji="💰")
     async def economy_menu(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -302,38 +419,7 @@ class PlayMainView(discord.ui.View):
             await interaction.response.send_message("This is not for you!", ephemeral=True)
             return
         
-        embed = create_embed(
-            title="💰 Economy & Trading",
-            description="Manage your wealth and items:",
-            color=discord.Color.gold()
-        )
-        
-        embed.add_field(
-            name="🛒 Shopping",
-            value="`/shop` - Browse and buy items\n`/daily` - Claim daily rewards",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📦 Inventory",
-            value="`/inventory` - Manage your items\n`/equipment` - View equipped gear",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🔨 Crafting",
-            value="`/craft` - Create powerful items",
-            inline=False
-        )
-        
-        # Direct command suggestions instead of broken view
-        embed.add_field(
-            name="🎮 Quick Actions", 
-            value="`/shop` - Browse shop\n`/inventory` - View items\n`/craft` - Start crafting",
-            inline=False
-        )
-        
-        await interaction.response.edit_message(embed=embed, view=None)
+        await interaction.response.edit_message(embed=_ECONOMY_EMBED, view=None)
 
     @discord.ui.button(label="🏰 Social", style=discord.ButtonStyle.primary, emoji="🏰")
     async def social_menu(self, interaction: discord.Interaction, button: discord.ui.Button):
@@ -341,32 +427,8 @@ class PlayMainView(discord.ui.View):
             await interaction.response.send_message("This is not for you!", ephemeral=True)
             return
         
-        embed = create_embed(
-            title="🏰 Social & Guilds",
-            description="Connect with other players:",
-            color=discord.Color.purple()
-        )
-        
-        embed.add_field(
-            name="🏰 Guild System",
-            value="`/guild` - Join or manage your guild",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="👥 Party System",
-            value="`/party` - Form temporary groups",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="📊 Leaderboards",
-            value="`/leaderboard` - See top players\n`/profile @user` - View player profiles",
-            inline=False
-        )
-        
-        view = GuildInteractiveView(self.bot, self.user_id)
-        await interaction.response.edit_message(embed=embed, view=view)
+        view = GuildInteractiveView(self.bot, self.user_id, in_faction=bool(self.character.get("faction")))
+        await interaction.response.edit_message(embed=_SOCIAL_EMBED, view=view)
 
 async def setup(bot):
     await bot.add_cog(PlayCog(bot))
@@ -43,6 +43,8 @@ class Settings(BaseSettings):
     BOT_PREFIX: str = os.getenv("BOT_PREFIX", "!")
     DEBUG_MODE: bool = os.getenv("DEBUG_MODE", "False").lower() == "true"
     BOT_OWNER_ID: int | None = int(os.getenv("BOT_OWNER_ID", "0")) if os.getenv("BOT_OWNER_ID") else None
+    # Register guild-scoped slash commands here instead of globally (fast dev sync)
+    DEV_GUILD_ID: int | None = int(os.getenv("DEV_GUILD_ID", "0")) if os.getenv("DEV_GUILD_ID") else None
     
     # Game Configuration
     MAX_LEVEL: int = 100
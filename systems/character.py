@@ -1,15 +1,22 @@
 import logging
-from typing import Dict, Optional, List
+import time
+from typing import Dict, Optional, List, Tuple
 from datetime import datetime
 from config import settings
 from utils.helpers import calculate_xp_for_level, calculate_level_from_xp, format_number
 
 logger = logging.getLogger(__name__)
 
+# Seconds a fetched character may be served from memory by get_cached
+CHARACTER_CACHE_TTL = 30.0
+CHARACTER_CACHE_SIZE = 256
+
 class CharacterSystem:
     def __init__(self, db, inventory_system=None):
         self.db = db
         self.inventory_system = inventory_system
+        # user_id -> (fetched_at, character, player version at fetch time)
+        self._character_cache: Dict[int, Tuple[float, Dict, tuple]] = {}
     
     async def create_character(self, user_id: int, username: str, character_class: str = "Warrior") -> Dict:
         """Create a new character for a user"""
@@ -131,6 +138,7 @@ class CharacterSystem:
     async def get_character(self, user_id: int) -> Optional[Dict]:
         """Get character data for a user"""
         try:
+            version = self.db.player_version(user_id)
             character = await self.db.get_player(user_id)
             if not character:
                 return None
@@ -139,12 +147,37 @@ class CharacterSystem:
             character["next_level_exp"] = self._calculate_next_level_exp(character["level"])
             character["level_progress"] = self._calculate_level_progress(character["experience"], character["level"])
             
+            cache = self._character_cache
+            cache.pop(user_id, None)
+            if len(cache) >= CHARACTER_CACHE_SIZE:
+                cache.pop(next(iter(cache)))
+            cache[user_id] = (time.monotonic(), character, version)
             return character
             
         except Exception as e:
             logger.error(f"Error getting character: {e}")
             return None
 
+    def get_cached(self, user_id: int) -> Optional[Dict]:
+        """Get a recently fetched character without touching the database"""
+        entry = self._character_cache.get(user_id)
+        if not entry:
+            return None
+        fetched_at, character, version = entry
+        if time.monotonic() - fetched_at > CHARACTER_CACHE_TTL or version != self.db.player_version(user_id):
+            self._character_cache.pop(user_id, None)
+            return None
+        return character
+
+    async def get_character_cached(self, user_id: int, max_age: float = 2.0) -> Optional[Dict]:
+        """Get a character, reusing the last fetch if it is under max_age seconds old and the player has not been saved since"""
+        entry = self._character_cache.get(user_id)
+        if entry is not None:
+            fetched_at, character, version = entry
+            if time.monotonic() - fetched_at < max_age and version == self.db.player_version(user_id):
+                return character
+        return await self.get_character(user_id)
+
     def _calculate_next_level_exp(self, level: int) -> int:
         """Calculate experience required for next level"""
         # Base experience formula: level^2 * 100
@@ -5,11 +5,21 @@ import os
 from datetime import datetime
 from config import settings
 
+try:
+    import orjson  # optional: faster parsing of the larger data files
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_JSON_DECODE_ERRORS = (json.JSONDecodeError, orjson.JSONDecodeError) if orjson else (json.JSONDecodeError,)
+
 class DatabaseManager:
     def __init__(self):
         self.use_json_fallback = True
+        # Bumped on every player write so callers can cache derived views of a player
+        self._player_versions: Dict[str, int] = {}
+        self._players_epoch = 0
         
     async def initialize(self):
         """Initialize database connections"""
@@ -180,12 +190,21 @@ class DatabaseManager:
         data = await self.load_json_data("players.json")
         return data.get(str(user_id))
     
+    def player_version(self, user_id: int) -> tuple:
+        """Token that changes whenever this player's saved data may have changed"""
+        return (self._players_epoch, self._player_versions.get(str(user_id), 0))
+
+    def _touch_player(self, user_id: int):
+        key = str(user_id)
+        self._player_versions[key] = self._player_versions.get(key, 0) + 1
+
     async def save_player(self, user_id: int, player_data: Dict):
         """Save player data to JSON"""
         try:
             players = await self.load_json_data("players.json")
             players[str(user_id)] = player_data
-            await self.save_json_data("players.json", players)
+            await self._write_json_data("players.json", players)
+            self._touch_player(user_id)
             return True
         except Exception as e:
             logger.error(f"Error saving player: {e}")
@@ -204,7 +223,8 @@ class DatabaseManager:
             for field, value in update_data.items():
                 players[user_id_str][field] = value
             
-            await self.save_json_data("players.json", players)
+            await self._write_json_data("players.json", players)
+            self._touch_player(user_id)
             return True
         except Exception as e:
             logger.error(f"Error updating character: {e}")
@@ -326,15 +346,24 @@ class DatabaseManager:
         """Load JSON data from file"""
         filepath = os.path.join("data", filename)
         try:
+            if orjson is not None:
+                with open(filepath, 'rb') as f:
+                    return orjson.loads(f.read())
             with open(filepath, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except FileNotFoundError:
             return {}
-        except json.JSONDecodeError:
+        except _JSON_DECODE_ERRORS:
             return {}
     
     async def save_json_data(self, filename: str, data: Dict) -> bool:
         """Save JSON data to file"""
+        if filename == "players.json":
+            # A direct write to the players file may touch any player
+            self._players_epoch += 1
+        return await self._write_json_data(filename, data)
+
+    async def _write_json_data(self, filename: str, data: Dict) -> bool:
         filepath = os.path.join("data", filename)
         try:
             os.makedirs("data", exist_ok=True)
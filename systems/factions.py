@@ -5,7 +5,8 @@ Ultra-low latency faction management with cooperative gameplay
 
 import logging
 import random
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
@@ -13,11 +14,48 @@ logger = logging.getLogger(__name__)
 INVITE_TTL_HOURS = 24
 DEFAULT_MEMBER_CAP = 50
 
+@dataclass(slots=True)
+class Faction:
+    name: str
+    description: str = ""
+    emoji: str = "🏳️"
+    bonus: Any = None  # stat key (paired with bonus_value) or {stat: value}
+    bonus_value: float = 0
+    members: List[int] = field(default_factory=list)
+    owner_id: Optional[int] = None
+    officers: List[int] = field(default_factory=list)
+    invites: Dict[str, Dict] = field(default_factory=dict)  # user_id(str) -> {inviter, created_at, expires_at}
+    member_cap: int = DEFAULT_MEMBER_CAP
+    level: int = 1
+    xp: int = 0
+    gold: int = 0
+    # Unmodelled keys from factions.json, written back untouched on save
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, faction_id: str, data: Dict) -> "Faction":
+        known = {k: v for k, v in data.items() if k in _FACTION_FIELDS}
+        extra = {k: v for k, v in data.items() if k not in _FACTION_FIELDS}
+        known.setdefault("name", faction_id)
+        # Explicit nulls in stored data fall back to defaults
+        for key in ("members", "officers", "invites"):
+            if known.get(key) is None:
+                known.pop(key, None)
+        return cls(**known, extra=extra)
+
+    def to_dict(self) -> Dict:
+        data = dict(self.extra)
+        for key in _FACTION_FIELDS:
+            data[key] = getattr(self, key)
+        return data
+
+_FACTION_FIELDS = tuple(f.name for f in fields(Faction) if f.name != "extra")
+
 class FactionSystem:
     def __init__(self, db, character_system):
         self.db = db
         self.character_system = character_system
-        self.factions = {}
+        self.factions: Dict[str, Faction] = {}
         self.faction_raids = {}
         
     async def initialize_factions(self):
@@ -31,85 +69,45 @@ class FactionSystem:
                     "description": "Noble warriors dedicated to justice and honor",
                     "emoji": "⚔️",
                     "bonus": "attack",
-                    "bonus_value": 10,
-                    "members": [],
-                    "owner_id": None,
-                    "officers": [],
-                    "invites": {},
-                    "member_cap": DEFAULT_MEMBER_CAP,
-                    "level": 1,
-                    "xp": 0,
-                    "gold": 0
+                    "bonus_value": 10
                 },
                 "mages": {
                     "name": "Arcane Circle",
                     "description": "Masters of magic and ancient knowledge",
                     "emoji": "🔮",
                     "bonus": "intelligence",
-                    "bonus_value": 15,
-                    "members": [],
-                    "owner_id": None,
-                    "officers": [],
-                    "invites": {},
-                    "member_cap": DEFAULT_MEMBER_CAP,
-                    "level": 1,
-                    "xp": 0,
-                    "gold": 0
+                    "bonus_value": 15
                 },
                 "rogues": {
                     "name": "Shadow Brotherhood",
                     "description": "Stealthy assassins and skilled thieves",
                     "emoji": "🗡️",
                     "bonus": "speed",
-                    "bonus_value": 12,
-                    "members": [],
-                    "owner_id": None,
-                    "officers": [],
-                    "invites": {},
-                    "member_cap": DEFAULT_MEMBER_CAP,
-                    "level": 1,
-                    "xp": 0,
-                    "gold": 0
+                    "bonus_value": 12
                 },
                 "merchants": {
                     "name": "Golden Guild",
                     "description": "Wealthy traders and economic masters",
                     "emoji": "💰",
                     "bonus": "gold_multiplier",
-                    "bonus_value": 1.2,
-                    "members": [],
-                    "owner_id": None,
-                    "officers": [],
-                    "invites": {},
-                    "member_cap": DEFAULT_MEMBER_CAP,
-                    "level": 1,
-                    "xp": 0,
-                    "gold": 0
+                    "bonus_value": 1.2
                 }
             }
-            
-            await self.db.save_json_data("factions.json", {"factions": default_factions})
-            self.factions = default_factions
+            self.factions = {fid: Faction.from_dict(fid, f) for fid, f in default_factions.items()}
+            await self._save_factions()
         else:
             # Accept both {"factions": {...}} and direct {...}
-            self.factions = factions_data.get("factions", factions_data)
-        # Ensure required keys exist
-        for fid, f in self.factions.items():
-            self._normalize_faction(f)
+            raw = factions_data.get("factions", factions_data)
+            self.factions = {fid: Faction.from_dict(fid, f) for fid, f in raw.items()}
     
-    def _normalize_faction(self, faction: Dict) -> None:
-        faction.setdefault("members", [])
-        faction.setdefault("owner_id", None)
-        faction.setdefault("officers", [])
-        faction.setdefault("invites", {})  # user_id(str) -> {inviter, created_at, expires_at}
-        faction.setdefault("member_cap", DEFAULT_MEMBER_CAP)
-        faction.setdefault("level", 1)
-        faction.setdefault("xp", 0)
-        faction.setdefault("gold", 0)
+    async def _save_factions(self) -> bool:
+        return await self.db.save_json_data(
+            "factions.json", {"factions": {fid: f.to_dict() for fid, f in self.factions.items()}}
+        )
     
-    def _apply_faction_bonus(self, character: Dict, faction: Dict, add: bool) -> None:
+    def _apply_faction_bonus(self, character: Dict, faction: Faction, add: bool) -> None:
         """Apply or remove faction bonus. Supports string+value or dict bonuses."""
-        bonus = faction.get("bonus")
+        bonus = faction.bonus
         if bonus is None:
             return
         # Ensure containers
@@ -130,9 +128,8 @@ class FactionSystem:
                     character["stats"][stat_key] = max(0, current + (value if add else -value))
         else:
             # treat as string key with separate bonus_value
-            bonus_value = faction.get("bonus_value", 0)
             try:
-                value = float(bonus_value)
+                value = float(faction.bonus_value)
             except Exception:
                 value = 0
             if bonus == "gold_multiplier":
@@ -155,30 +152,29 @@ class FactionSystem:
             return {"success": False, "message": "You are already in a faction"}
         
         faction = self.factions[faction_id]
-        self._normalize_faction(faction)
         # Enforce cap
-        if len(faction["members"]) >= int(faction.get("member_cap", DEFAULT_MEMBER_CAP)):
+        if len(faction.members) >= int(faction.member_cap):
             return {"success": False, "message": "This faction is full"}
         
         # Join faction
-        if user_id not in faction["members"]:
-            faction["members"].append(user_id)
-        if not faction.get("owner_id"):
-            faction["owner_id"] = user_id
+        if user_id not in faction.members:
+            faction.members.append(user_id)
+        if not faction.owner_id:
+            faction.owner_id = user_id
         
         # Remove invite if exists
-        faction["invites"].pop(str(user_id), None)
+        faction.invites.pop(str(user_id), None)
         
         # Apply faction bonus (supports dict or string)
         self._apply_faction_bonus(character, faction, add=True)
         
         character["faction"] = faction_id
         await self.db.save_player(user_id, character)
-        await self.db.save_json_data("factions.json", {"factions": self.factions})
+        await self._save_factions()
         
         return {
             "success": True,
-            "message": f"Welcome to {faction.get('name', faction_id)}!"
+            "message": f"Welcome to {faction.name}!"
         }
     
     async def leave_faction(self, user_id: int) -> Dict:
@@ -194,35 +190,34 @@ class FactionSystem:
         faction = self.factions.get(faction_id)
         if not faction:
             return {"success": False, "message": "Faction not found"}
-        self._normalize_faction(faction)
         
-        if faction.get("owner_id") == user_id and len(faction.get("members", [])) > 1:
+        if faction.owner_id == user_id and len(faction.members) > 1:
             return {"success": False, "message": "Transfer ownership before leaving"}
         
         # Remove from faction
         try:
-            faction["members"].remove(user_id)
+            faction.members.remove(user_id)
         except ValueError:
             pass
-        if faction.get("owner_id") == user_id:
-            faction["owner_id"] = None
-        if user_id in faction.get("officers", []):
-            faction["officers"] = [m for m in faction["officers"] if m != user_id]
+        if faction.owner_id == user_id:
+            faction.owner_id = None
+        if user_id in faction.officers:
+            faction.officers = [m for m in faction.officers if m != user_id]
         
         # Remove faction bonus
         self._apply_faction_bonus(character, faction, add=False)
         
         character["faction"] = None
         await self.db.save_player(user_id, character)
-        await self.db.save_json_data("factions.json", {"factions": self.factions})
+        await self._save_factions()
         
         return {"success": True, "message": "You have left your faction"}
     
-    async def get_faction_info(self, faction_id: str) -> Optional[Dict]:
+    async def get_faction_info(self, faction_id: str) -> Optional[Faction]:
         """Get faction information"""
         return self.factions.get(faction_id)
     
-    async def get_all_factions(self) -> Dict:
+    async def get_all_factions(self) -> Dict[str, Faction]:
         """Get all factions"""
         return self.factions
     
@@ -248,21 +243,21 @@ class FactionSystem:
         
         # Add to faction treasury
         faction = self.factions[faction_id]
-        faction["gold"] = faction.get("gold", 0) + gold_amount
+        faction.gold += gold_amount
         
         # Add faction XP
         xp_gain = gold_amount // 10
-        faction["xp"] = faction.get("xp", 0) + xp_gain
+        faction.xp += xp_gain
         
         # Check for faction level up
-        new_level = (faction["xp"] // 1000) + 1
-        if new_level > faction.get("level", 1):
-            faction["level"] = new_level
+        new_level = (faction.xp // 1000) + 1
+        if new_level > faction.level:
+            faction.level = new_level
             level_bonus = f"Faction leveled up to level {new_level}!"
         else:
             level_bonus = ""
         
-        await self.db.save_json_data("factions.json", {"factions": self.factions})
+        await self._save_factions()
         
         return {
             "success": True,
@@ -281,7 +276,7 @@ class FactionSystem:
             return {"success": False, "message": "You must be in a faction to start raids"}
         
         faction = self.factions[faction_id]
-        if len(faction["members"]) < 2:
+        if len(faction.members) < 2:
             return {"success": False, "message": "Need at least 2 faction members for raids"}
         
         # Create raid
@@ -333,12 +328,12 @@ class FactionSystem:
         for faction_id, faction in self.factions.items():
             factions_list.append({
                 "id": faction_id,
-                "name": faction.get("name"),
-                "emoji": faction.get("emoji"),
-                "level": faction.get("level", 1),
-                "xp": faction.get("xp", 0),
-                "members": len(faction.get("members", [])),
-                "gold": faction.get("gold", 0)
+                "name": faction.name,
+                "emoji": faction.emoji,
+                "level": faction.level,
+                "xp": faction.xp,
+                "members": len(faction.members),
+                "gold": faction.gold
             })
         
         # Sort by level (descending), then by XP (descending)
@@ -346,14 +341,14 @@ class FactionSystem:
         return factions_list
 
     # ==== Roles & Membership Management ====
-    def _member_role(self, faction: Dict, user_id: int) -> Optional[str]:
+    def _member_role(self, faction: Optional[Faction], user_id: int) -> Optional[str]:
         if not faction:
             return None
-        if faction.get("owner_id") == user_id:
+        if faction.owner_id == user_id:
             return "owner"
-        if user_id in faction.get("officers", []):
+        if user_id in faction.officers:
             return "officer"
-        if user_id in faction.get("members", []):
+        if user_id in faction.members:
             return "member"
         return None
 
@@ -361,15 +356,14 @@ class FactionSystem:
         faction = self.factions.get(faction_id)
         if not faction:
             return {"success": False, "message": "Faction not found"}
-        self._normalize_faction(faction)
         role = self._member_role(faction, inviter_id)
         if role not in ("owner", "officer"):
             return {"success": False, "message": "Only owner or officers can invite"}
-        if target_id in faction["members"]:
+        if target_id in faction.members:
             return {"success": False, "message": "User is already a member"}
         key = str(target_id)
         now = datetime.utcnow()
-        existing = faction["invites"].get(key)
+        existing = faction.invites.get(key)
         if existing:
             try:
                 exp = datetime.fromisoformat(existing.get("expires_at"))
@@ -377,19 +371,19 @@ class FactionSystem:
                     return {"success": False, "message": "Invite already pending"}
             except Exception:
                 pass
-        faction["invites"][key] = {
+        faction.invites[key] = {
             "inviter": inviter_id,
             "created_at": now.isoformat(),
             "expires_at": (now + timedelta(hours=INVITE_TTL_HOURS)).isoformat()
         }
-        await self.db.save_json_data("factions.json", {"factions": self.factions})
+        await self._save_factions()
         return {"success": True, "message": "Invite sent"}
 
     async def list_invites_for_user(self, user_id: int) -> List[Dict]:
         now = datetime.utcnow()
         results: List[Dict] = []
         for fid, f in self.factions.items():
-            inv = f.get("invites", {}).get(str(user_id))
+            inv = f.invites.get(str(user_id))
             if not inv:
                 continue
             try:
@@ -397,14 +391,14 @@ class FactionSystem:
                     continue
             except Exception:
                 pass
-            results.append({"faction_id": fid, "faction_name": f.get("name"), **inv})
+            results.append({"faction_id": fid, "faction_name": f.name, **inv})
         return results
 
     async def accept_invite(self, user_id: int, faction_id: str) -> Dict:
         faction = self.factions.get(faction_id)
         if not faction:
             return {"success": False, "message": "Faction not found"}
-        inv = faction.get("invites", {}).get(str(user_id))
+        inv = faction.invites.get(str(user_id))
         if not inv:
             return {"success": False, "message": "No invite found"}
         try:
@@ -421,51 +415,50 @@ class FactionSystem:
         role = self._member_role(faction, actor_id)
         if role not in ("owner", "officer"):
             return {"success": False, "message": "Not permitted"}
-        if str(target_id) in faction.get("invites", {}):
-            faction["invites"].pop(str(target_id), None)
-            await self.db.save_json_data("factions.json", {"factions": self.factions})
+        if str(target_id) in faction.invites:
+            faction.invites.pop(str(target_id), None)
+            await self._save_factions()
         return {"success": True, "message": "Invite revoked"}
 
     async def promote_officer(self, owner_id: int, target_id: int, faction_id: str) -> Dict:
         faction = self.factions.get(faction_id)
         if not faction:
             return {"success": False, "message": "Faction not found"}
-        if faction.get("owner_id") != owner_id:
+        if faction.owner_id != owner_id:
             return {"success": False, "message": "Only owner can promote"}
-        if target_id not in faction.get("members", []):
+        if target_id not in faction.members:
             return {"success": False, "message": "Target is not a member"}
-        if target_id in faction.get("officers", []):
+        if target_id in faction.officers:
             return {"success": False, "message": "Already an officer"}
-        faction["officers"].append(target_id)
-        await self.db.save_json_data("factions.json", {"factions": self.factions})
+        faction.officers.append(target_id)
+        await self._save_factions()
         return {"success": True, "message": "Promoted to officer"}
 
     async def demote_officer(self, owner_id: int, target_id: int, faction_id: str) -> Dict:
         faction = self.factions.get(faction_id)
         if not faction:
             return {"success": False, "message": "Faction not found"}
-        if faction.get("owner_id") != owner_id:
+        if faction.owner_id != owner_id:
             return {"success": False, "message": "Only owner can demote"}
-        if target_id not in faction.get("officers", []):
+        if target_id not in faction.officers:
             return {"success": False, "message": "Target is not an officer"}
-        faction["officers"] = [m for m in faction["officers"] if m != target_id]
-        await self.db.save_json_data("factions.json", {"factions": self.factions})
+        faction.officers = [m for m in faction.officers if m != target_id]
+        await self._save_factions()
         return {"success": True, "message": "Demoted officer"}
 
     async def kick_member(self, actor_id: int, target_id: int, faction_id: str) -> Dict:
         faction = self.factions.get(faction_id)
         if not faction:
             return {"success": False, "message": "Faction not found"}
-        self._normalize_faction(faction)
         role = self._member_role(faction, actor_id)
         if role not in ("owner", "officer"):
             return {"success": False, "message": "Not permitted"}
-        if target_id not in faction.get("members", []):
+        if target_id not in faction.members:
             return {"success": False, "message": "Target is not a member"}
-        if target_id == faction.get("owner_id"):
+        if target_id == faction.owner_id:
             return {"success": False, "message": "Cannot kick the owner"}
         # Officers cannot kick other officers
-        if role == "officer" and target_id in faction.get("officers", []):
+        if role == "officer" and target_id in faction.officers:
             return {"success": False, "message": "Officers cannot kick officers"}
         
         # Update target character
@@ -476,25 +469,25 @@ class FactionSystem:
             target_char["faction"] = None
             await self.db.save_player(target_id, target_char)
         
-        faction["members"] = [m for m in faction["members"] if m != target_id]
-        if target_id in faction.get("officers", []):
-            faction["officers"] = [m for m in faction["officers"] if m != target_id]
-        await self.db.save_json_data("factions.json", {"factions": self.factions})
+        faction.members = [m for m in faction.members if m != target_id]
+        if target_id in faction.officers:
+            faction.officers = [m for m in faction.officers if m != target_id]
+        await self._save_factions()
         return {"success": True, "message": "Member removed"}
 
     async def transfer_ownership(self, owner_id: int, target_id: int, faction_id: str) -> Dict:
         faction = self.factions.get(faction_id)
         if not faction:
             return {"success": False, "message": "Faction not found"}
-        if faction.get("owner_id") != owner_id:
+        if faction.owner_id != owner_id:
             return {"success": False, "message": "Only owner can transfer"}
-        if target_id not in faction.get("members", []):
+        if target_id not in faction.members:
             return {"success": False, "message": "Target must be a member"}
         if target_id == owner_id:
             return {"success": False, "message": "Already the owner"}
-        faction["owner_id"] = target_id
+        faction.owner_id = target_id
         # make previous owner an officer (if not already)
-        if owner_id not in faction.get("officers", []):
-            faction["officers"].append(owner_id)
-        await self.db.save_json_data("factions.json", {"factions": self.factions})
+        if owner_id not in faction.officers:
+            faction.officers.append(owner_id)
+        await self._save_factions()
         return {"success": True, "message": "Ownership transferred"}
@@ -67,6 +67,32 @@ class InventorySystem:
         
         return False
     
+    def _take_item(self, character: Dict, item_id: str, quantity: int) -> bool:
+        """Remove quantity of an item from a loaded character, without saving"""
+        inventory = character.get("inventory", [])
+        
+        # Find the item
+        for i, inv_item in enumerate(inventory):
+            if inv_item.get("id", inv_item.get("name")) == item_id:
+                current_quantity = inv_item.get("quantity", 1)
+                
+                if current_quantity < quantity:
+                    # Not enough items
+                    return False
+                
+                if current_quantity == quantity:
+                    # Remove item completely
+                    inventory.pop(i)
+                else:
+                    # Reduce quantity
+                    inv_item["quantity"] = current_quantity - quantity
+                
+                character["inventory"] = inventory
+                return True
+        
+        # Item not found
+        return False
+
     async def consume_item(self, user_id: int, item_id: str, quantity: int = 1) -> bool:
         """Consume an item from player's inventory"""
         try:
@@ -74,35 +100,64 @@ class InventorySystem:
             if not character:
                 return False
             
-            inventory = character.get("inventory", [])
-            
-            # Find the item
-            for i, inv_item in enumerate(inventory):
-                if inv_item.get("id", inv_item.get("name")) == item_id:
-                    current_quantity = inv_item.get("quantity", 1)
-                    
-                    if current_quantity >= quantity:
-                        if current_quantity == quantity:
-                            # Remove item completely
-                            inventory.pop(i)
-                        else:
-                            # Reduce quantity
-                            inv_item["quantity"] = current_quantity - quantity
-                        
-                        character["inventory"] = inventory
-                        await self.db.save_player(user_id, character)
-                        return True
-                    else:
-                        # Not enough items
-                        return False
+            if not self._take_item(character, item_id, quantity):
+                return False
             
-            # Item not found
-            return False
+            await self.db.save_player(user_id, character)
+            return True
             
         except Exception as e:
             logger.error(f"Error consuming item: {e}")
             return False
 
+    async def use_and_apply(self, user_id: int, item_id: str, hp_delta: int = 0, sp_delta: int = 0) -> Dict:
+        """Consume one item and apply its HP/SP restoration in a single save"""
+        try:
+            character = await self.db.get_player(user_id)
+            if not character:
+                return {"success": False, "message": "Character not found!"}
+            
+            if not self._take_item(character, item_id, 1):
+                return {"success": False, "message": "You don't have this item anymore!"}
+            
+            result = {"success": True, "hp_restored": 0, "sp_restored": 0}
+            if hp_delta:
+                current_hp = character.get("hp", character.get("max_hp", 100))
+                new_hp = min(current_hp + hp_delta, character.get("max_hp", 100))
+                character["hp"] = new_hp
+                result["hp_restored"] = new_hp - current_hp
+            
+            if sp_delta:
+                current_sp = character.get("sp", character.get("max_sp", 50))
+                new_sp = min(current_sp + sp_delta, character.get("max_sp", 50))
+                character["sp"] = new_sp
+                result["sp_restored"] = new_sp - current_sp
+            
+            await self.db.save_player(user_id, character)
+            return result
+            
+        except Exception as e:
+            logger.error(f"Error using item: {e}")
+            return {"success": False, "message": "Error using item"}
+
+    async def sell_item(self, user_id: int, item_id: str, quantity: int, gold: int) -> Dict:
+        """Remove sold items and credit gold in a single save"""
+        try:
+            character = await self.db.get_player(user_id)
+            if not character:
+                return {"success": False, "message": "Character not found!"}
+            
+            if not self._take_item(character, item_id, quantity):
+                return {"success": False, "message": "You don't have enough of this item!"}
+            
+            character["gold"] = character.get("gold", 0) + gold
+            await self.db.save_player(user_id, character)
+            return {"success": True, "gold": character["gold"]}
+            
+        except Exception as e:
+            logger.error(f"Error selling item: {e}")
+            return {"success": False, "message": "Error selling item"}
+
     async def save_inventory(self, user_id: int, inventory: List[Dict]) -> bool:
         """Save inventory to player data"""
         try:
@@ -18,6 +18,11 @@ class PartySystem:
         self.active_parties = {}
         self.party_invites = {}
         
+    def _mark_changed(self, party: Dict):
+        """Refresh derived fields after a membership or settings change"""
+        party["member_count"] = len(party["members"])
+        party["_embed_version"] = party.get("_embed_version", 0) + 1
+    
     async def create_party(self, leader_id: int, party_name: str = None) -> Dict:
         """Create a new party"""
         character = await self.character_system.get_character(leader_id)
@@ -36,6 +41,8 @@ class PartySystem:
             "name": party_name,
             "leader_id": leader_id,
             "members": [leader_id],
+            "member_count": 1,
+            "_embed_version": 0,
             "max_members": 4,
             "created_at": datetime.utcnow().isoformat(),
             "status": "active",
@@ -118,6 +125,7 @@ class PartySystem:
         
         # Add to party
         party["members"].append(target_id)
+        self._mark_changed(party)
         invite["status"] = "accepted"
         
         return {"success": True, "party": party, "message": f"Joined {party['name']}!"}
@@ -139,10 +147,12 @@ class PartySystem:
                 new_leader_id = next(member_id for member_id in party["members"] if member_id != player_id)
                 party["leader_id"] = new_leader_id
                 party["members"].remove(player_id)
+                self._mark_changed(party)
                 return {"success": True, "message": "Leadership transferred and you left the party"}
         else:
             # Regular member leaving
             party["members"].remove(player_id)
+            self._mark_changed(party)
             return {"success": True, "message": "Left the party"}
     
     async def kick_member(self, leader_id: int, target_id: int) -> Dict:
@@ -161,6 +171,7 @@ class PartySystem:
             return {"success": False, "message": "You cannot kick yourself"}
         
         party["members"].remove(target_id)
+        self._mark_changed(party)
         return {"success": True, "message": "Player kicked from party"}
     
     async def start_party_combat(self, leader_id: int, monster_data: Dict) -> Dict:
@@ -286,4 +297,5 @@ class PartySystem:
             return {"success": False, "message": "Only the party leader can change settings"}
         
         party["settings"].update(settings)
+        self._mark_changed(party)
         return {"success": True, "message": "Party settings updated"}
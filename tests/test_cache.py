@@ -0,0 +1,61 @@
+import asyncio
+from types import SimpleNamespace
+
+from utils.cache import PlayerCache, TTLCache
+
+
+def _counting_loader(calls: list, value="v"):
+    async def loader():
+        calls.append(1)
+        await asyncio.sleep(0)
+        return value
+    return loader
+
+
+def test_player_cache_reloads_when_version_changes():
+    versions = {1: (0, 0)}
+    db = SimpleNamespace(player_version=lambda uid: versions[uid])
+    cache, calls = PlayerCache(), []
+
+    async def run():
+        await cache.get(db, 1, _counting_loader(calls))
+        await cache.get(db, 1, _counting_loader(calls))
+        versions[1] = (0, 1)
+        await cache.get(db, 1, _counting_loader(calls))
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_player_cache_evicts_oldest_user():
+    db = SimpleNamespace(player_version=lambda uid: (0, 0))
+    cache = PlayerCache(maxsize=2)
+
+    async def run():
+        for uid in (1, 2, 3):
+            await cache.get(db, uid, _counting_loader([], uid))
+
+    asyncio.run(run())
+    assert list(cache._entries) == [2, 3]
+
+
+def test_ttl_cache_shares_one_load_between_concurrent_misses():
+    cache, calls = TTLCache(60.0), []
+
+    async def run():
+        return await asyncio.gather(*(cache.get("k", _counting_loader(calls)) for _ in range(5)))
+
+    assert asyncio.run(run()) == ["v"] * 5
+    assert len(calls) == 1
+
+
+def test_ttl_cache_invalidate_forces_reload():
+    cache, calls = TTLCache(60.0), []
+
+    async def run():
+        await cache.get("k", _counting_loader(calls))
+        cache.invalidate("k")
+        await cache.get("k", _counting_loader(calls))
+
+    asyncio.run(run())
+    assert len(calls) == 2
@@ -0,0 +1,50 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+pytest.importorskip("discord")
+
+from cogs.inventory import InventoryCategoryView, InventoryMainView, _load_inventory
+
+
+def _bot():
+    item = {"id": "sword", "name": "Sword", "type": "Weapon", "rarity": "common", "quantity": 1, "price": 10}
+    return SimpleNamespace(
+        db=SimpleNamespace(player_version=lambda uid: (0, 0)),
+        inventory_system=SimpleNamespace(get_inventory=AsyncMock(side_effect=lambda uid: [dict(item)])),
+        character_system=SimpleNamespace(get_character=AsyncMock(return_value={"gold": 5, "equipment": {}})),
+    )
+
+
+def _interaction(user_id: int):
+    return SimpleNamespace(
+        user=SimpleNamespace(id=user_id),
+        response=SimpleNamespace(defer=AsyncMock(), send_message=AsyncMock()),
+        edit_original_response=AsyncMock(),
+    )
+
+
+async def _back(bot, user_id: int, parent):
+    category = InventoryCategoryView(bot, user_id, list(parent.inventory), parent.character, "All", parent_view=parent)
+    interaction = _interaction(user_id)
+    await category.back_to_inventory.callback(interaction)
+    return interaction.edit_original_response.await_args.kwargs["view"]
+
+
+@pytest.mark.asyncio
+async def test_back_reuses_live_parent_when_nothing_changed():
+    bot = _bot()
+    parent = InventoryMainView(bot, 101, *await _load_inventory(bot, 101))
+    assert await _back(bot, 101, parent) is parent
+
+
+@pytest.mark.asyncio
+async def test_back_builds_new_view_when_parent_timed_out():
+    bot = _bot()
+    parent = InventoryMainView(bot, 102, *await _load_inventory(bot, 102))
+    parent.stop()
+    view = await _back(bot, 102, parent)
+    assert isinstance(view, InventoryMainView)
+    assert view is not parent
+    assert not view.is_finished()
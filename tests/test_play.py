@@ -0,0 +1,35 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+pytest.importorskip("discord")
+
+from cogs.guild_interactive import GuildInteractiveView
+from cogs.play import PlayMainView
+
+
+def _interaction(user_id: int):
+    return SimpleNamespace(
+        user=SimpleNamespace(id=user_id),
+        response=SimpleNamespace(edit_message=AsyncMock(), send_message=AsyncMock()),
+    )
+
+
+@pytest.mark.asyncio
+async def test_play_main_view_takes_character():
+    character = {"username": "tester", "faction": None}
+    view = PlayMainView(SimpleNamespace(), 1, character)
+    assert view.user_id == 1
+    assert view.character is character
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("faction, in_faction", [(None, False), ("red", True)])
+async def test_social_menu_opens_guild_view(faction, in_faction):
+    view = PlayMainView(SimpleNamespace(), 1, {"username": "tester", "faction": faction})
+    interaction = _interaction(1)
+    await view.social_menu.callback(interaction)
+    sent = interaction.response.edit_message.await_args.kwargs["view"]
+    assert isinstance(sent, GuildInteractiveView)
+    assert sent.in_faction is in_faction
@@ -0,0 +1,62 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+Loader = Callable[[], Awaitable[Any]]
+
+class PlayerCache:
+    """Per-user results reused until that player's data is saved again, capped at maxsize users"""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        # user_id -> (player version at load time, value)
+        self._entries: Dict[int, tuple] = {}
+
+    async def get(self, db, user_id: int, loader: Loader):
+        """Cached value for user_id, or the result of loader() if their player version moved on"""
+        version = db.player_version(user_id)
+        entry = self._entries.get(user_id)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+
+        value = await loader()
+        entries = self._entries
+        entries.pop(user_id, None)
+        if len(entries) >= self.maxsize:
+            entries.pop(next(iter(entries)))
+        entries[user_id] = (version, value)
+        return value
+
+class TTLCache:
+    """Results of async loaders reused for ttl seconds; concurrent misses on a key share one load"""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        # key -> (expires_at, value)
+        self._entries: Dict[Hashable, tuple] = {}
+        self._locks: Dict[Hashable, asyncio.Lock] = {}
+
+    async def get(self, key: Hashable, loader: Loader):
+        """Cached value for key, or the result of loader() once it has expired"""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        lock = self._locks.get(key)
+        if lock is None:
+            lock = self._locks[key] = asyncio.Lock()
+        async with lock:
+            # Whoever held the lock before us may already have reloaded
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            value = await loader()
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+        return value
+
+    def invalidate(self, key: Hashable = None):
+        """Force the next get() of key, or of every key, to reload"""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)